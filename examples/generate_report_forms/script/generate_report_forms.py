@@ -14,6 +14,9 @@ prepared with columns that will eventually be filled in manually by a
 person(s) tasked with reviewing the data for each team.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from openpyxl.styles.numbers import BUILTIN_FORMATS
 from src import xlsx_copycull
@@ -24,62 +27,100 @@ from src import xlsx_copycull
 # https://openpyxl.readthedocs.io/en/stable/_modules/openpyxl/styles/numbers.html
 ACCOUNTING_FORMAT = BUILTIN_FORMATS[44]
 
-if __name__ == '__main__':
-    # Master spreadsheet location and information.
-    master_spreadsheet = Path(r"examples\generate_report_forms\script\original\purchase_data.xlsx")
-    sheet_name = 'Accounting'
-    header_row = 1
-
-    # Where we'll save the report forms.
-    report_directory = Path(r"examples\generate_report_forms\script\reports")
+# Master spreadsheet information.
+SHEET_NAME = 'Accounting'
+HEADER_ROW = 1
+
+# Skip loading anything the reports don't need. (But keep formulas,
+# rather than streaming mode's default of their last-calculated values,
+# so that the formulas in the sample rows carry over to each report.)
+LOAD_KWARGS = {
+    'data_only': False,
+    'keep_links': False,
+    'keep_vba': False,
+    'rich_text': False,
+}
+
+# The master spreadsheet, loaded once in each worker process (by
+# `load_master()`) and shared by every report that the worker generates.
+master_wrapper = None
+
+
+def load_master(master_spreadsheet):
+    """
+    Load the master spreadsheet in streaming mode, caching its rows in
+    memory, so that it only gets parsed once no matter how many reports
+    are generated from it. (With ``fast_xml=True``, each report is
+    spliced into a copy of the master spreadsheet, so its column widths,
+    frozen panes, autofilter, etc. are kept.)
+
+    :param master_spreadsheet: Filepath to the master spreadsheet.
+    :return: None
+    """
+    global master_wrapper
+    master_wrapper = xlsx_copycull.WorkbookWrapper(
+        orig_fp=master_spreadsheet,
+        streaming=True,
+        cache_rows=True,
+        fast_xml=True,
+        load_kwargs=LOAD_KWARGS)
+    master_wrapper.load_wb()
+    return None
+
+
+def generate_one(team_code, report_directory):
+    """
+    Generate the report form for a single team from the already-loaded
+    master spreadsheet.
+
+    :param team_code: The 'Team Code' whose report form to generate.
+    :param report_directory: Directory in which to save the report form
+     (as a string).
+    :return: None
+    """
+    wb_wrapper = master_wrapper
 
     # The second and third rows contain samples for the reviewers to
     # reference, so we want to keep them in each copy.
     sample_rows = {2, 3}
 
-    # The original spreadsheet has 'Team Code' values from 7 to 23.
-    team_codes = range(7, 24)
-
-    # Generate a report form for each team.
-    for team_code in team_codes:
-        # Filename for each report will encode the team code.
-        report_name = f"Team {team_code:02d} Expense Verification Report.xlsx"
-
-        # Copy the master spreadsheet using that filename.
-        wb_wrapper = xlsx_copycull.WorkbookWrapper(
-            orig_fp=master_spreadsheet,
-            copy_fp=report_directory / report_name)
-        wb_wrapper.load_wb()
-
-        # We'll keep only items that cost at least $10.00/item, and
-        # whose costs were incurred by this team.
-        # If this were a SQL query, it might look like:
-        #    SELECT *
-        #    FROM SomeTable
-        #    WHERE price_per_item >= 10 AND team_code = '<this team>';
-        select_conditions = {
-            'Price Per Item': lambda ppi: ppi >= 10,
-            'Team Code': lambda tc: tc == team_code
-        }
-
-        # Formula in Column G to multiply each row's C-value by E-value.
-        formulas_to_add = {
-            'G': lambda row_num: f"=C{row_num}*E{row_num}"
-        }
-        # Apply 'Accounting' format to each of the resulting formulas
-        # in Column G.
-        num_formats = {
-            'G': ACCOUNTING_FORMAT
-        }
-
-        # Stage the 'Accounting' worksheet and rename it for this team.
-        ws_wrapper = wb_wrapper.stage_ws(
-            ws_name=sheet_name,
-            header_row=header_row,
-            protected_rows=sample_rows,
-            rename_ws=f"{team_code:02d}_expense_verif"
-        )
-
+    # Filename for each report will encode the team code.
+    report_name = f"Team {team_code:02d} Expense Verification Report.xlsx"
+
+    # We'll keep only items that cost at least $10.00/item, and
+    # whose costs were incurred by this team.
+    # If this were a SQL query, it might look like:
+    #    SELECT *
+    #    FROM SomeTable
+    #    WHERE price_per_item >= 10 AND team_code = '<this team>';
+    select_conditions = {
+        'Price Per Item': xlsx_copycull.NumericCondition('>=', 10),
+        'Team Code': lambda tc: tc == team_code
+    }
+
+    # Formula in Column G to multiply each row's C-value by E-value.
+    formulas_to_add = {
+        'G': lambda row_num: f"=C{row_num}*E{row_num}"
+    }
+    # Apply 'Accounting' format to each of the resulting formulas
+    # in Column G.
+    num_formats = {
+        'G': ACCOUNTING_FORMAT
+    }
+
+    # Stage the 'Accounting' worksheet.
+    # (Staging it afresh discards any culls made for the previous team.)
+    ws_wrapper = wb_wrapper.stage_ws(
+        ws_name=SHEET_NAME,
+        header_row=HEADER_ROW,
+        protected_rows=sample_rows
+    )
+
+    # Rename it for this team -- but this worker's master spreadsheet is
+    # shared by every team it is given, so always restore the original
+    # name afterward, even if this report fails.
+    ws_wrapper.rename_ws(f"{team_code:02d}_expense_verif")
+    try:
         # Delete unwanted rows
         ws_wrapper.cull(select_conditions=select_conditions, bool_oper='AND')
         # Add formulas, and add appropriate formatting to those same cells
@@ -90,6 +131,37 @@ if __name__ == '__main__':
         # could iterate over the cells in `modified_cells` (keyed by
         # column letter, i.e. 'G'; whose value is a list of cell names).
 
-        # Save and close.
-        wb_wrapper.save_wb()
-        wb_wrapper.close_wb()
+        # Stream the remaining rows into the report form under that
+        # filename.
+        wb_wrapper.save_wb(os.path.join(report_directory, report_name))
+    finally:
+        ws_wrapper.rename_ws(SHEET_NAME)
+    return None
+
+
+if __name__ == '__main__':
+    # Master spreadsheet location.
+    master_spreadsheet = Path(r"examples\generate_report_forms\script\original\purchase_data.xlsx")
+
+    # Where we'll save the report forms.
+    report_directory = Path(r"examples\generate_report_forms\script\reports")
+
+    # The original spreadsheet has 'Team Code' values from 7 to 23.
+    team_codes = range(7, 24)
+
+    # Generate a report form for each team. Each report is independent
+    # of the others, so they are generated in parallel (one process per
+    # team, up to the number of CPUs). Each worker process loads the
+    # master spreadsheet once, and then reuses it for every team it is
+    # given. (The workers all open the same file, which the OS caches in
+    # memory after the first read -- so there's no need to share its
+    # bytes between processes ourselves.)
+    # Pass the directory as a plain string, to be joined with each
+    # report name without building a new Path object per report.
+    generate = partial(
+        generate_one, report_directory=os.fspath(report_directory))
+    with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=load_master,
+            initargs=(master_spreadsheet,)) as executor:
+        list(executor.map(generate, team_codes))
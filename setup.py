@@ -12,31 +12,38 @@ license = 'MIT'
 MODULE_DIR = 'src/xlsx_copycull'
 
 
-def get_constant(constant):
+def get_constants():
     setters = {
         "version": "__version__ = ",
         "author": "__author__ = ",
         "author_email": "__email__ = ",
         "url": "__website__ = "
     }
-    var_setter = setters[constant]
+    constants = {}
     with open(Path(rf"{MODULE_DIR}/_constants.py"), "r") as file:
         for line in file:
-            if line.startswith(var_setter):
-                var = line[len(var_setter):].strip('\'\n \"')
-                return var
-        raise RuntimeError(f"Could not get {constant} info.")
+            for constant, var_setter in setters.items():
+                if line.startswith(var_setter):
+                    var = line[len(var_setter):].strip('\'\n \"')
+                    constants.setdefault(constant, var)
+    for constant in setters:
+        if constant not in constants:
+            raise RuntimeError(f"Could not get {constant} info.")
+    return constants
+
+
+constants = get_constants()
 
 
 setup(
     name='xlsx_copycull',
-    version=get_constant("version"),
+    version=constants["version"],
     packages=['xlsx_copycull'],
     package_dir={'': 'src'},
-    url=get_constant("url"),
+    url=constants["url"],
     license=license,
-    author=get_constant("author"),
-    author_email=get_constant("author_email"),
+    author=constants["author"],
+    author_email=constants["author_email"],
     description=description,
     long_description=long_description,
     install_requires=[
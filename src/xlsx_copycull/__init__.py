@@ -16,6 +16,7 @@ __website__ = _constants.__website__
 
 from .xlsx_copycull import (
     add_formulas_to_column,
+    NumericCondition,
     WorkbookWrapper,
     WorksheetWrapper
 )
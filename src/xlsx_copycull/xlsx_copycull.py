@@ -8,17 +8,36 @@ formulas afterward.
 """
 
 import os
+import re
 import shutil
+import zipfile
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from datetime import date, time, timedelta
+from itertools import compress, islice, repeat, starmap
+from operator import eq, ge, gt, itemgetter, le, lt, ne
 from pathlib import Path
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import NamedStyle
+from openpyxl.styles.numbers import BUILTIN_FORMATS_REVERSE
+from openpyxl.utils import column_index_from_string, get_column_letter
+from openpyxl.utils.datetime import to_excel
+from xml.sax.saxutils import escape, unescape
 
 
 __all__ = [
     'add_formulas_to_column',
+    'NumericCondition',
     'WorkbookWrapper',
     'WorksheetWrapper',
 ]
 
+# Saved workbooks are written through a 256 KiB buffer (rather than the
+# default 8 KiB), for far fewer write syscalls.
+_SAVE_BUFFERING = 1 << 18
+
 
 class WorkbookWrapper:
     """
@@ -68,11 +87,20 @@ class WorkbookWrapper:
             orig_fp: Path,
             copy_fp: Path = None,
             uid=None,
-            no_copy=False):
+            no_copy=False,
+            streaming=False,
+            cache_rows=False,
+            fast_xml=False,
+            load_kwargs: dict = None,
+            autoload=False,
+            data_only: bool = None,
+            keep_vba: bool = None,
+            keep_links: bool = None):
         """
         A wrapper for an openpyxl Workbook object. Access the Workbook
-        object directly in the ``.wb`` attribute.  The Workbook will
-        be loaded at init.
+        object directly in the ``.wb`` attribute.  The Workbook is not
+        loaded at init -- load it with ``.load_wb()`` (or pass
+        ``autoload=True``).
 
         .. note::
 
@@ -83,7 +111,11 @@ class WorkbookWrapper:
           property.
 
         :param orig_fp: Filepath to the workbook to load (and copy from).
-         Must be in the ``.xlsx`` or ``.xlsm`` formats!
+         Must be in the ``.xlsx`` or ``.xlsm`` formats! This may
+         instead be a binary file-like object (e.g., a ``BytesIO`` of a
+         workbook already read into memory), in which case its contents
+         are written to ``copy_fp`` (or, in streaming mode, read
+         directly).
         :param copy_fp: Filepath at which to save the copied workbook.
          The filename should end in ``'.xlsx'`` or ``'.xlsm'``.
         :param uid: (Optional) An internal unique identifier.
@@ -94,6 +126,76 @@ class WorkbookWrapper:
           .. warning::
             Using ``no_copy`` will irrevocably modify the original
             spreadsheet.
+
+        :param streaming: (Optional) Use openpyxl's optimized modes,
+         which is much faster and uses far less memory for large
+         spreadsheets. The original spreadsheet will be opened in
+         read-only mode, and the copy will not be written until
+         ``.save_wb()`` is called, at which point only the rows that
+         survived ``.cull()`` (plus any formulas added with
+         ``.add_formulas()``) are streamed into a write-only workbook at
+         ``copy_fp``. (In streaming mode, ``copy_fp`` may be omitted, in
+         which case the filepath must be passed to ``.save_wb()``.)
+         Defaults to ``False``.
+
+          .. warning::
+            In streaming mode, only cell values and cell styles are
+            carried over to the copy. Any formulas in the original
+            spreadsheet are replaced with their last-calculated values,
+            and column widths, merged cells, etc. will be lost.
+            Streaming mode cannot be combined with ``no_copy=True``.
+
+        :param cache_rows: (Optional, streaming mode only) Keep the rows
+         of each worksheet in memory after they are first parsed, so
+         that later calls to ``.cull()`` and ``.save_wb()`` do not parse
+         the original spreadsheet again. This is useful when generating
+         many copies from the same loaded workbook (re-staging the
+         worksheet and calling ``.save_wb(fp=<path>)`` for each one).
+         Defaults to ``False``.
+        :param fast_xml: (Optional, streaming mode only) Instead of
+         rebuilding the whole workbook with openpyxl, write the XML of
+         each modified worksheet directly into a copy of the original
+         ``.xlsx`` archive, and copy every other part of the archive
+         (styles, column widths, unmodified worksheets, etc.) as-is.
+         This is faster to save, and keeps more of the original
+         formatting. Defaults to ``False``.
+
+          .. warning::
+            With ``fast_xml=True``, worksheets cannot be deleted, and
+            any merged cells, conditional formatting, etc. in a culled
+            worksheet will NOT be moved to follow their rows (as is
+            also the case when openpyxl deletes rows).
+
+        :param load_kwargs: (Optional) A dict of keyword arguments to pass
+         to ``openpyxl.load_workbook()`` every time the workbook is
+         loaded (e.g., ``{'keep_vba': False, 'rich_text': False}``). Any
+         features that aren't needed can be switched off to load the
+         workbook faster. See ``.load_wb()`` for details.
+
+          .. warning::
+            Passing ``data_only=True`` outside of streaming mode will
+            permanently replace any formulas in the copy with their
+            last-calculated values.
+
+        :param autoload: (Optional) Load the workbook automatically the
+         first time a method needs it to be open (e.g., ``.cull()``,
+         ``.add_formulas()``, ``.rename_ws()``), rather than raising a
+         ``RuntimeError``. A workbook that is never modified is then
+         never parsed at all. Defaults to ``False``.
+        :param data_only: (Optional) Shortcut for the parameter of the
+         same name in ``openpyxl.load_workbook()`` -- i.e., equivalent to
+         passing it in ``load_kwargs`` (and subject to the same warning
+         above).
+        :param keep_vba: (Optional) Shortcut for the parameter of the
+         same name in ``openpyxl.load_workbook()``.
+        :param keep_links: (Optional) Shortcut for the parameter of the
+         same name in ``openpyxl.load_workbook()``. Pass ``False`` to
+         skip parsing any links to external workbooks, if the copy does
+         not need them.
+
+         If any of these three are not specified, openpyxl's defaults
+         apply (or, in streaming mode, ``data_only=True`` and
+         ``keep_links=False``; see ``.load_wb()``).
         """
         # a dict of subordinate WorksheetWrapper objects
         self.ws_dict = {}
@@ -103,9 +205,49 @@ class WorkbookWrapper:
         self.wb = None
 
         self.uid = uid
-        self.orig_fp = Path(orig_fp)
+        self.streaming = streaming
+        self.cache_rows = cache_rows
+        self.fast_xml = fast_xml
+        self.autoload = autoload
+        if load_kwargs is None:
+            load_kwargs = {}
+        load_kwargs = dict(load_kwargs)
+        shortcuts = {
+            'data_only': data_only,
+            'keep_vba': keep_vba,
+            'keep_links': keep_links,
+        }
+        for kwarg, val in shortcuts.items():
+            if val is not None:
+                load_kwargs[kwarg] = val
+        self.load_kwargs = load_kwargs
+        # Streaming mode only: parsed rows, keyed by read-only worksheet
+        # (only populated if `cache_rows=True`).
+        self._row_cache = {}
+        # ...and the values of any columns used by `.cull()`, keyed by
+        # (read-only worksheet, column index).
+        self._column_cache = {}
+        # `fast_xml` only: the title of each read-only worksheet when the
+        # workbook was loaded.
+        self._orig_titles = {}
+        if hasattr(orig_fp, 'read'):
+            # A file-like object (only readable, so never modified).
+            if no_copy:
+                raise ValueError(
+                    "Cannot use `no_copy=True` with a file-like `orig_fp`.")
+            self.orig_fp = orig_fp
+        else:
+            self.orig_fp = Path(orig_fp)
+        if no_copy and streaming:
+            raise ValueError(
+                "Cannot use `streaming=True` with `no_copy=True`. "
+                "Specify `copy_fp=<path>` to stream to a new file.")
+        if fast_xml and not streaming:
+            raise ValueError("`fast_xml=True` requires `streaming=True`.")
         if no_copy:
             self.copy_fp = self.orig_fp
+        elif copy_fp is None and streaming:
+            self.copy_fp = None
         elif copy_fp is None:
             raise ValueError(
                 "specify `copy_fp=<path>` to create a copy, "
@@ -114,6 +256,9 @@ class WorkbookWrapper:
             raise ValueError(
                 "Cannot copy source to its same filepath."
                 "Use `no_copy=True` to modify the original file.")
+        elif streaming:
+            # The copy is written out by `.save_wb()`.
+            self.copy_fp = Path(copy_fp)
         else:
             self.copy_fp = Path(copy_fp)
             self.copy_original()
@@ -227,7 +372,12 @@ class WorkbookWrapper:
             fp = self.copy_fp
         fp = Path(fp)
         os.makedirs(fp.parent, exist_ok=True)
-        shutil.copy(self.orig_fp, fp)
+        if hasattr(self.orig_fp, 'read'):
+            self.orig_fp.seek(0)
+            with open(fp, 'wb', buffering=_SAVE_BUFFERING) as file:
+                shutil.copyfileobj(self.orig_fp, file)
+        else:
+            _fastcopy(self.orig_fp, fp)
         self.copy_fp = fp
         return None
 
@@ -252,9 +402,14 @@ class WorkbookWrapper:
         are now open for modification -- by setting their ``.ws``
         attributes to the appropriate openpyxl worksheet object).
 
+        In streaming mode, the original workbook at ``.orig_fp`` is
+        opened in read-only mode instead (by default, with
+        ``data_only=True`` and ``keep_links=False``).
+
         :param _load_workbook_kwargs: (Optional, unsupported) Keyword
          arguments to pass through to the ``openpyxl.load_workbook()``
-         method. See openpyxl's documentation_ for optional parameters.
+         method, on top of any ``load_kwargs`` passed at init. See
+         openpyxl's documentation_ for optional parameters.
 
          .. _documentation: https://openpyxl.readthedocs.io/en/stable/api/openpyxl.reader.excel.html#openpyxl.reader.excel.load_workbook
 
@@ -267,7 +422,18 @@ class WorkbookWrapper:
         """
         if self.is_loaded:
             return
-        self.wb = openpyxl.load_workbook(self.copy_fp, **_load_workbook_kwargs)
+        load_kwargs = {**self.load_kwargs, **_load_workbook_kwargs}
+        if self.streaming:
+            load_kwargs = {
+                'data_only': True,
+                'keep_links': False,
+                **load_kwargs,
+                'read_only': True,
+            }
+            self.wb = openpyxl.load_workbook(self.orig_fp, **load_kwargs)
+            self._orig_titles = {ws: ws.title for ws in self.wb.worksheets}
+        else:
+            self.wb = openpyxl.load_workbook(self.copy_fp, **load_kwargs)
         # Update all of the staged worksheets.
         self._inform_subordinates()
         return None
@@ -281,12 +447,13 @@ class WorkbookWrapper:
         attributes to their respective openpyxl worksheet.
         :return: None
         """
-        is_loaded = self.is_loaded
+        wb = self.wb
+        if wb is None:
+            for ws_wrapper in self.ws_dict.values():
+                ws_wrapper.ws = None
+            return None
         for ws_name, ws_wrapper in self.ws_dict.items():
-            ws = None
-            if is_loaded:
-                ws = self.wb[ws_name]
-            ws_wrapper.ws = ws
+            ws_wrapper.ws = wb[ws_name]
         return None
 
     def close_wb(self) -> None:
@@ -299,6 +466,9 @@ class WorkbookWrapper:
             return None
         self.wb.close()
         self.wb = None
+        self._row_cache.clear()
+        self._column_cache.clear()
+        self._orig_titles = {}
         # Update all of the staged worksheets.
         self._inform_subordinates()
         return None
@@ -315,12 +485,169 @@ class WorkbookWrapper:
         self.mandate_loaded()
         if fp is None:
             fp = self.copy_fp
-        self.wb.save(fp)
+        if fp is None:
+            raise ValueError("specify `fp=<path>` at which to save.")
+        if self.streaming:
+            self._stream_wb(fp)
+        else:
+            with open(fp, 'wb', buffering=_SAVE_BUFFERING) as file:
+                self.wb.save(file)
+        return None
+
+    def _stream_wb(self, fp) -> None:
+        """
+        INTERNAL USE:
+
+        Stream every worksheet in the read-only ``.wb`` into a new
+        write-only workbook, dropping any rows that were culled and
+        writing any formulas that were added, and save it to ``fp``.
+        """
+        fp = Path(fp)
+        if fp == self.orig_fp or (
+                isinstance(self.orig_fp, Path) and fp.exists()
+                and os.path.samefile(fp, self.orig_fp)):
+            raise ValueError(
+                "Cannot stream the copy to the filepath of the original.")
+        os.makedirs(fp.parent, exist_ok=True)
+        if self.fast_xml:
+            self._splice_wb(fp)
+            return None
+        out_wb = openpyxl.Workbook(write_only=True)
+        # Styles are resolved once per source style, and then shared.
+        style_cache = {}
+        for ws in self.wb.worksheets:
+            out_ws = out_wb.create_sheet(ws.title)
+            ws_wrapper = self.ws_dict.get(ws.title)
+            kept_rows = None
+            formula_cells = None
+            if ws_wrapper is not None:
+                kept_rows = ws_wrapper._row_map
+                formula_cells = ws_wrapper._formula_cells
+            _stream_rows(
+                self._iter_rows(ws), out_ws, style_cache, kept_rows,
+                formula_cells)
+        with open(fp, 'wb', buffering=_SAVE_BUFFERING) as file:
+            out_wb.save(file)
+        out_wb.close()
+        return None
+
+    def _splice_wb(self, fp) -> None:
+        """
+        INTERNAL USE (``fast_xml=True``):
+
+        Copy the archive of the original workbook to ``fp``, part by
+        part, writing new sheet data for each worksheet that was culled
+        or had formulas added, and renaming any renamed worksheets.
+        Every other part is copied as-is. (The calculation chain is
+        dropped, since it may refer to cells that have moved; Excel
+        rebuilds it on its own.)
+        """
+        if len(self.wb.worksheets) != len(self._orig_titles):
+            raise RuntimeError(
+                "Worksheets cannot be deleted with `fast_xml=True`.")
+        renames = {}
+        rewrites = {}
+        for ws, orig_title in self._orig_titles.items():
+            if ws.title != orig_title:
+                renames[orig_title] = ws.title
+            ws_wrapper = self.ws_dict.get(ws.title)
+            if ws_wrapper is None:
+                continue
+            if ws_wrapper._row_map is None and not ws_wrapper._formula_cells:
+                continue
+            rewrites[ws._worksheet_path] = (ws, ws_wrapper)
+        with zipfile.ZipFile(self.orig_fp) as src, \
+                open(fp, 'wb', buffering=_SAVE_BUFFERING) as file, \
+                zipfile.ZipFile(file, 'w', zipfile.ZIP_DEFLATED) as dst:
+            parts = _content_type_parts(src.read(_CONTENT_TYPES_PART))
+            styles_part = parts.get('styles')
+            styles = None
+            if styles_part is not None:
+                styles = _StylesPatch(src.read(styles_part).decode('utf-8'))
+            drop_calc_chain = bool(rewrites)
+            for info in src.infolist():
+                name = info.filename
+                if name in rewrites:
+                    ws, ws_wrapper = rewrites[name]
+                    with dst.open(name, 'w') as out:
+                        _write_sheet_xml(
+                            src.read(name),
+                            out,
+                            rows=self._iter_rows(ws),
+                            dimension=ws_wrapper._dimension(),
+                            kept_rows=ws_wrapper._row_map,
+                            formula_cells=ws_wrapper._formula_cells,
+                            styles=styles,
+                            epoch=self.wb.epoch)
+                    continue
+                if name == styles_part:
+                    # Written last, after any new formats are added.
+                    continue
+                if drop_calc_chain and name == parts.get('calc_chain'):
+                    continue
+                data = src.read(name)
+                if renames and name == parts.get('workbook'):
+                    data = _rename_sheets_xml(data, renames)
+                elif drop_calc_chain and (
+                        name == _CONTENT_TYPES_PART or name.endswith('.rels')):
+                    data = _CALC_CHAIN_REF.sub(b'', data)
+                dst.writestr(info, data)
+            if styles is not None:
+                dst.writestr(src.getinfo(styles_part), styles.to_xml())
         return None
 
+    def _iter_rows(self, ws, values_only=False):
+        """
+        INTERNAL USE (streaming mode):
+
+        Iterate over every row in a read-only worksheet, as tuples of
+        cells (or of values, if ``values_only=True``). If
+        ``cache_rows=True`` was passed at init, the rows will only be
+        parsed the first time, and will then be served from memory until
+        the workbook is closed.
+
+        :param ws: An openpyxl read-only worksheet in ``.wb``.
+        :param values_only: Whether to yield only the cell values.
+        """
+        if not self.cache_rows:
+            yield from ws.iter_rows(values_only=values_only)
+            return
+        rows = self._row_cache.get(ws)
+        if rows is None:
+            rows = self._row_cache[ws] = list(ws.iter_rows())
+        if not values_only:
+            yield from rows
+            return
+        for row in rows:
+            yield tuple(cell.value for cell in row)
+
+    def _column(self, ws, col_idx) -> tuple:
+        """
+        INTERNAL USE (streaming mode, with ``cache_rows=True``):
+
+        Get the values in a column of a read-only worksheet (one per
+        original row), which are read out of the cached rows the first
+        time, and then cached as a tuple until the workbook is closed.
+
+        :param ws: An openpyxl read-only worksheet in ``.wb``.
+        :param col_idx: The column index (indexed to 0).
+        """
+        key = (ws, col_idx)
+        col = self._column_cache.get(key)
+        if col is None:
+            col = self._column_cache[key] = tuple(
+                row[col_idx].value for row in self._iter_rows(ws))
+        return col
+
     def mandate_loaded(self):
-        """Raise an error if the ``.wb`` is not currently loaded."""
+        """
+        Raise an error if the ``.wb`` is not currently loaded (or load
+        it now, if ``.autoload`` is set).
+        """
         if not self.is_loaded:
+            if self.autoload:
+                self.load_wb()
+                return None
             raise RuntimeError(
                 "Workbook is not currently open. Use the `.load_wb()` method.")
         return None
@@ -347,6 +674,73 @@ class WorkbookWrapper:
         self.ws_dict[old_name].rename_ws(new_name=new_name)
         return None
 
+    def cull_all(
+            self,
+            conditions_per_sheet: dict,
+            bool_oper='AND',
+            max_workers: int = None) -> None:
+        """
+        Cull several staged worksheets at once. The select conditions
+        for each worksheet are checked in parallel threads (one per
+        worksheet), and then the rows are deleted from each worksheet,
+        one worksheet at a time. The result is the same as calling
+        ``.cull()`` on each worksheet in turn:
+
+        .. code-block::
+
+            wb_wrapper.cull_all({
+                'Sheet1': {'Price': NumericCondition('>=', 10)},
+                'Sheet2': {'Team Code': lambda x: x == 7},
+            })
+
+        .. note::
+
+          Any worksheet's ``.protected_rows`` are used (and adjusted),
+          just as with ``.cull()`` when ``protected_rows`` is not
+          passed.
+
+        If any select condition raises an error, it is raised here, and
+        none of the worksheets are culled.
+
+        :param conditions_per_sheet: A dict, keyed by the name of each
+         staged worksheet to cull, and whose values are the
+         ``select_conditions`` for that worksheet (see ``.cull()``).
+        :param bool_oper: Which boolean operator to apply to the select
+         conditions of each worksheet -- either ``'AND'``, ``'OR'``, or
+         ``'XOR'``. (Defaults to ``'AND'``.)
+        :param max_workers: (Optional) The maximum number of threads to
+         use. Defaults to one per worksheet (within the default limit
+         of ``ThreadPoolExecutor``).
+        :return: None
+        """
+        self.mandate_loaded()
+        ws_wrappers = {
+            ws_name: self[ws_name] for ws_name, select_conditions
+            in conditions_per_sheet.items() if select_conditions
+        }
+        if not ws_wrappers:
+            return None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                ws_name: executor.submit(
+                    ws_wrapper._rows_to_keep,
+                    conditions_per_sheet[ws_name],
+                    bool_oper,
+                    ws_wrapper.protected_rows)
+                for ws_name, ws_wrapper in ws_wrappers.items()
+            }
+        # Collect every result first, so that if any select condition
+        # raised an error, no worksheet has been culled.
+        to_keep = {
+            ws_name: future.result() for ws_name, future in futures.items()}
+        # openpyxl is not thread-safe for writes, so delete serially.
+        for ws_name, ws_wrapper in ws_wrappers.items():
+            ws_wrapper._delete_unkept(
+                to_keep[ws_name],
+                ws_wrapper.protected_rows,
+                store_protected_rows=True)
+        return None
+
 
 class WorksheetWrapper:
     """
@@ -392,14 +786,132 @@ class WorksheetWrapper:
         self.protected_rows = self._populate_protected_rows(
             protected_rows, first_modifiable_row)
         self.last_protected_rows = self.protected_rows
+        # Streaming mode only: The original row numbers that survived
+        # `.cull()` (``None`` if nothing has been culled), and the
+        # formulas to write, keyed by original row number.
+        self._row_map = None
+        self._formula_cells = {}
+        # The worksheet and header row that the cached headers were read
+        # from, and the headers (see `._header_index()`).
+        self._header_cache = None
 
     @property
     def is_loaded(self):
         return self.ws is not None
 
+    @property
+    def streaming(self):
+        return self.wb_wrapper.streaming
+
+    def _max_row(self) -> int:
+        """
+        INTERNAL USE:
+
+        Get the current number of rows in the worksheet (after accounting
+        for any rows culled in streaming mode).
+        """
+        if self._row_map is not None:
+            return len(self._row_map)
+        if self.ws.max_row is None or self.ws.max_column is None:
+            # Read-only worksheets may be unsized (and its rows would
+            # then not be padded to a uniform width).
+            self.ws.calculate_dimension(force=True)
+        return self.ws.max_row
+
+    def _dimension(self) -> str:
+        """
+        INTERNAL USE (streaming mode):
+
+        Get the range of cells (e.g. ``'A1:K62'``) that the worksheet
+        will span when it is written, after accounting for any culled
+        rows and any formulas added beyond the existing rows or columns.
+        """
+        max_row = self._max_row()
+        max_col = self.ws.max_column
+        if self._formula_cells:
+            max_row += max(max(self._formula_cells) - self.ws.max_row, 0)
+            # (Skipping any rows that have no formulas staged.)
+            max_col = max([
+                max_col,
+                *(max(fc) for fc in self._formula_cells.values() if fc)])
+        return f"A1:{get_column_letter(max_col)}{max_row}"
+
+    def _row_values(self, min_row=1):
+        """
+        INTERNAL USE:
+
+        Get the current rows of the worksheet (i.e. those that have not
+        been culled), starting from ``min_row``. Returns a 2-tuple of a
+        range of the current row numbers, and an iterator of tuples of
+        each row's values (in the same order).
+        """
+        max_row = self._max_row()
+        if not self.streaming:
+            rows = self.ws.iter_rows(
+                min_row=min_row, max_row=max_row, values_only=True)
+            return range(min_row, max_row + 1), rows
+        rows = self.wb_wrapper._iter_rows(self.ws, values_only=True)
+        return range(min_row, max_row + 1), self._current(rows, min_row)
+
+    def _column_values(self, col_idxs, min_row=1):
+        """
+        INTERNAL USE:
+
+        Like ``._row_values()``, but the iterator yields only the values
+        in the columns at ``col_idxs`` (indexed to 0) -- as tuples, if
+        more than one column is requested. In streaming mode with
+        ``cache_rows=True``, each column is read out of the cached rows
+        only once, and later culls zip the cached columns back together
+        rather than pulling the values out of every row again. Outside
+        of streaming mode, only the span of the requested columns is
+        read from the worksheet.
+        """
+        if not self.streaming:
+            max_row = self._max_row()
+            min_col = min(col_idxs)
+            rows = self.ws.iter_rows(
+                min_row=min_row, max_row=max_row, min_col=min_col + 1,
+                max_col=max(col_idxs) + 1, values_only=True)
+            getter = itemgetter(*(col_idx - min_col for col_idx in col_idxs))
+            return range(min_row, max_row + 1), map(getter, rows)
+        if not self.wb_wrapper.cache_rows:
+            row_nums, rows = self._row_values(min_row)
+            return row_nums, map(itemgetter(*col_idxs), rows)
+        max_row = self._max_row()
+        cols = [
+            self._current(self.wb_wrapper._column(self.ws, col_idx), min_row)
+            for col_idx in col_idxs
+        ]
+        vals = cols[0] if len(cols) == 1 else zip(*cols)
+        return range(min_row, max_row + 1), vals
+
+    def _current(self, orig_vals, min_row=1):
+        """
+        INTERNAL USE (streaming mode):
+
+        Skip whatever has been culled from ``orig_vals`` (an iterable with
+        one entry per original row), and then anything before
+        ``min_row``. The culled rows are skipped with ``compress()``
+        against a mask of the original rows, rather than checked one by
+        one.
+        """
+        if self._row_map is not None:
+            keep_mask = bytearray(self.ws.max_row)
+            for orig_row_num in self._row_map:
+                keep_mask[orig_row_num - 1] = 1
+            orig_vals = compress(orig_vals, keep_mask)
+        return islice(orig_vals, min_row - 1, None)
+
     def mandate_loaded(self):
-        """Raise an error if the ``.wb`` is not currently loaded."""
+        """
+        Raise an error if the ``.wb`` is not currently loaded (or load
+        it now, if the parent ``WorkbookWrapper`` has ``.autoload``
+        set).
+        """
         if not self.is_loaded:
+            if self.wb_wrapper.autoload:
+                self.wb_wrapper.load_wb()
+                return None
             raise RuntimeError("Workbook is not currently open")
         return None
 
@@ -416,12 +928,10 @@ class WorksheetWrapper:
         if first_modifiable_row <= 0:
             first_modifiable_row = header_row + 1
 
-        protected_rows = set()
-        if explicitly_protected is not None:
-            protected_rows = set(explicitly_protected)
-
-        protected_rows.update(set(range(1, first_modifiable_row)))
+        protected_rows = set(range(1, first_modifiable_row))
         protected_rows.add(header_row)  # Never delete the header.
+        if explicitly_protected is not None:
+            protected_rows.update(explicitly_protected)
         return protected_rows
 
     def rename_ws(self, new_name) -> None:
@@ -438,6 +948,7 @@ class WorksheetWrapper:
         # Update the parent WBWrapper with the new sheet name, and
         # discard the old name.
         self.wb_wrapper.ws_dict[new_name] = self.wb_wrapper.ws_dict.pop(old_name)
+        self.invalidate_header_cache()
         return None
 
     def cull(self, select_conditions: dict, bool_oper='AND', protected_rows=None):
@@ -445,9 +956,16 @@ class WorksheetWrapper:
         Cull the spreadsheet, based on the ``select_conditions``.  If
         more than one select condition is used (i.e. more than one key
         in ``select_conditions``), specify whether to apply ``'AND'``,
-        ``'OR'``, or ``'XOR'`` boolean logic to the resulting sets by
+        ``'OR'``, or ``'XOR'`` boolean logic to their results by
         passing one of those as ``bool_oper`` (defaults to ``'AND'``).
 
+        The rows are checked in a single pass over their values (with
+        ``.iter_rows(values_only=True)``), and then deleted all at once.
+        Since only values are read, a workbook that is opened in
+        streaming mode (``WorkbookWrapper(..., streaming=True)``) is
+        checked straight from openpyxl's read-only parser, without ever
+        loading the full workbook into memory.
+
         .. note::
 
           ``protected_rows`` is a list (or set) of integers, being
@@ -476,7 +994,14 @@ class WorksheetWrapper:
          value of the cell under that column, which returns a bool. If
          the function returns ``False`` (or a ``False``-like value) when
          applied to the cell's value, that row will be marked for
-         deletion.
+         deletion. A value may instead be a ``NumericCondition`` (e.g.,
+         ``NumericCondition('>=', 10)``), which is faster for simple
+         comparisons against a fixed threshold. To apply more than one
+         select condition to the same column, pass a list (or tuple) of
+         them under its header (e.g., ``{'Price': [NumericCondition('>=',
+         10), NumericCondition('<', 100)]}``); they are combined by
+         ``bool_oper``, like any others, but the column is only read
+         once.
 
         :param bool_oper: When using more than one select conditions
          (i.e. more than one key in the dict), use this to determine
@@ -503,45 +1028,55 @@ class WorksheetWrapper:
             protected_rows = self.protected_rows
             store_protected_rows = True
 
-        header_row = self.header_row
-        ws = self.ws
-        all_to_keep = []
-        # Apply each select condition to the appropriate column.
-        for field, keepable in select_conditions.items():
-            match_col = self.find_match_col(header_row, field)
-            # Keep all those rows that match our criteria or are protected.
-            to_keep = []
-            for row_num in range(header_row + 1, ws.max_row + 1):
-                if row_num in protected_rows:
-                    to_keep.append(row_num)
-                cell_val = ws.cell(row=row_num, column=match_col).value
-                if keepable(cell_val):
-                    to_keep.append(row_num)
-            all_to_keep.append(set(to_keep))
-
-        # Apply the boolean operator to determine which rows to keep.
-        final_to_keep = self._apply_bool_operator(all_to_keep, bool_oper)
-        final_to_keep.update(protected_rows)
-        # Delete everything else.
-        to_delete = set(range(1, ws.max_row + 1)) - final_to_keep
-
-        # Convert our raw to_delete list down to a list of 2-tuples (ranges,
-        # inclusive of min/max), and delete those from bottom-up.
-        rges = find_ranges(to_delete)
-        rges.reverse()
-        for rge in rges:
-            row = rge[0]
-            num_rows_to_delete = rge[1] - rge[0] + 1
-            ws.delete_rows(row, num_rows_to_delete)
-
-        # Adjust any protected row numbers upward, if any higher rows
-        # were deleted
-        protected_rows_after_cull = []
-        for row_num in protected_rows:
-            for rge in rges:
-                if rge[1] < row_num:
-                    row_num -= (rge[1] - rge[0] + 1)
-            protected_rows_after_cull.append(row_num)
+        final_to_keep = self._rows_to_keep(
+            select_conditions, bool_oper, protected_rows)
+        self._delete_unkept(
+            final_to_keep, protected_rows, store_protected_rows)
+        return None
+
+    def _delete_unkept(
+            self, final_to_keep, protected_rows, store_protected_rows):
+        """
+        INTERNAL USE:
+
+        Delete every row that is not in ``final_to_keep`` (or in
+        ``protected_rows``), and adjust the protected rows to their new
+        positions (see ``.cull()``).
+
+        :param final_to_keep: A sorted list of the row numbers to keep,
+         as returned by ``._rows_to_keep()`` (i.e. without any of the
+         ``protected_rows``).
+        :param protected_rows: A set of the row numbers to protect.
+        :param store_protected_rows: Whether to also store the adjusted
+         protected rows to ``.protected_rows``.
+        :return: None
+        """
+        max_row = self._max_row()
+        # Delete everything else. Everything below works from the sorted
+        # kept rows, so culling most of a large sheet costs no more than
+        # the rows that survive. (The kept rows are already in order, so
+        # sorting the protected rows in among them is close to linear.)
+        kept = [*final_to_keep, *protected_rows]
+        kept.sort()
+        # (Protected rows may lie beyond the end of the sheet.)
+        del kept[bisect_right(kept, max_row):]
+        if self.streaming:
+            # Nothing is deleted until the rows are streamed at save.
+            row_map = self._row_map
+            if row_map is None:
+                row_map = range(1, max_row + 1)
+            self._row_map = [row_map[row_num - 1] for row_num in kept]
+        elif len(kept) < max_row:
+            # Delete every row at once.
+            self._rebuild_rows(kept)
+
+        # Adjust any protected row numbers upward, by however many rows
+        # were deleted above each one (counted by bisecting the kept
+        # rows).
+        protected_rows_after_cull = [
+            row_num - (min(row_num - 1, max_row) - bisect_left(kept, row_num))
+            for row_num in protected_rows
+        ]
 
         new_protected_rows = set(protected_rows_after_cull)
         self.last_protected_rows = new_protected_rows
@@ -550,6 +1085,206 @@ class WorksheetWrapper:
 
         return None
 
+    def _rebuild_rows(self, to_keep: list) -> None:
+        """
+        INTERNAL USE:
+
+        Delete every row NOT in ``to_keep`` from ``.ws`` in a single pass,
+        by renumbering the surviving cells into a new cell dict (rather
+        than calling ``.delete_rows()`` per range, each of which sorts
+        and shifts every cell below it -- quadratic for many ranges).
+        The worksheet itself is kept, so its column widths, frozen
+        panes, etc. are unaffected -- with the same results as
+        ``.delete_rows()``.
+
+        :param to_keep: A sorted list of the row numbers to keep.
+        """
+        ws = self.ws
+        max_row = ws.max_row
+        # The new row number of each original row (0 if deleted). Only
+        # the kept rows are visited, so a cull that deletes most of the
+        # sheet is no slower than one that deletes little of it.
+        new_row_nums = [0] * (max_row + 1)
+        for new_row_num, row_num in enumerate(to_keep, start=1):
+            new_row_nums[row_num] = new_row_num
+        cells = {}
+        for (row_num, col_num), cell in ws._cells.items():
+            new_row_num = new_row_nums[row_num]
+            if new_row_num:
+                cell.row = new_row_num
+                cells[new_row_num, col_num] = cell
+        ws._cells = cells
+        ws._current_row = ws.max_row if cells else 0
+        return None
+
+    def _rows_to_keep(
+            self, select_conditions, bool_oper, protected_rows=None) -> list:
+        """
+        INTERNAL USE:
+
+        Determine which rows to keep, in a single pass over the values
+        of the rows, applying a single predicate (see
+        ``._compile_predicate()``) to the relevant values in each row.
+        Returns a sorted list of the rows to keep (not including
+        protected rows, which get added back by ``.cull()``). The select
+        conditions are never applied to any of the ``protected_rows``.
+        """
+        header_row = self.header_row
+        col_idxs = []
+        keepables = []
+        for field, keepable in select_conditions.items():
+            col_idx = self.find_match_col(header_row, field) - 1
+            if not isinstance(keepable, (list, tuple)):
+                keepable = [keepable]
+            if not keepable:
+                raise ValueError(f"No select conditions for {field!r}.")
+            for each_keepable in keepable:
+                col_idxs.append(col_idx)
+                keepables.append(each_keepable)
+        if len(keepables) > 1 and bool_oper.upper() in ('AND', 'OR'):
+            order = self._selectivity_order(
+                col_idxs, keepables, bool_oper, protected_rows)
+            col_idxs = [col_idxs[i] for i in order]
+            keepables = [keepables[i] for i in order]
+        # Each column is only read once, however many select conditions
+        # are applied to it.
+        columns = list(dict.fromkeys(col_idxs))
+        arg_idxs = [columns.index(col_idx) for col_idx in col_idxs]
+        predicate = self._compile_predicate(keepables, bool_oper, arg_idxs)
+        # Feed the values for the select conditions to the predicate,
+        # entirely in C-level iterators.
+        row_nums, vals = self._column_values(columns, min_row=header_row + 1)
+        skip = [r for r in (protected_rows or ()) if r in row_nums]
+        if skip:
+            # Drop the protected rows from both, in the same C-level way.
+            unprotected = bytearray(b'\x01') * len(row_nums)
+            for row_num in skip:
+                unprotected[row_num - row_nums.start] = 0
+            row_nums = list(compress(row_nums, unprotected))
+            vals = compress(vals, unprotected)
+        if len(columns) > 1:
+            results = starmap(predicate, vals)
+        elif len(keepables) == 1 and isinstance(keepables[0], NumericCondition):
+            results = self._compare_column(keepables[0], vals, predicate)
+        else:
+            results = map(predicate, vals)
+        return list(compress(row_nums, results))
+
+    @staticmethod
+    def _compare_column(condition, vals, predicate) -> list:
+        """
+        INTERNAL USE:
+
+        Apply a lone ``NumericCondition`` to a whole column of values at
+        once, by mapping its comparison operator straight over the
+        column (one C-level loop, with no Python-level call per value).
+        If the column has any blank cells (which never match, even for
+        ``'!='``), or any value can't be compared to the threshold,
+        falls back to the compiled ``predicate`` for the column.
+
+        :param condition: The ``NumericCondition`` to apply.
+        :param vals: The values of the column.
+        :param predicate: The compiled predicate for ``condition``.
+        :return: A list of bools, one per value.
+        """
+        vals = list(vals)
+        if None not in vals:
+            comparison = NumericCondition.OPERATORS[condition.op]
+            try:
+                return list(
+                    map(comparison, vals, repeat(condition.threshold)))
+            except TypeError:
+                pass
+        return list(map(predicate, vals))
+
+    def _selectivity_order(
+            self, col_idxs, keepables, bool_oper, protected_rows=None,
+            sample_size=256) -> list:
+        """
+        INTERNAL USE:
+
+        Estimate from a sample of the first rows below the header (not
+        counting any of the ``protected_rows``, to which the select
+        conditions are never applied) how often each select condition
+        keeps a row, and return the indexes of the select conditions in
+        the order they should be evaluated: those that reject the most
+        rows first for ``'AND'``, or those that keep the most rows first
+        for ``'OR'``. (Since the compiled predicate short-circuits, this
+        minimizes how many select conditions get called per row.) Ties
+        keep their original order, and if any select condition raises an
+        error on the sample, the original order is kept entirely.
+        """
+        order = list(range(len(keepables)))
+        row_nums, rows = self._row_values(min_row=self.header_row + 1)
+        if protected_rows:
+            rows = (
+                row for row_num, row in zip(row_nums, rows)
+                if row_num not in protected_rows)
+        sample = list(islice(rows, sample_size))
+        try:
+            hits = [
+                sum(1 for row in sample if keepable(row[col_idx]))
+                for col_idx, keepable in zip(col_idxs, keepables)
+            ]
+        except Exception:
+            # Leave it to the full pass to raise, in the original order.
+            return order
+        order.sort(key=hits.__getitem__, reverse=bool_oper.upper() == 'OR')
+        return order
+
+    @staticmethod
+    def _compile_predicate(keepables, bool_oper, arg_idxs=None):
+        """
+        INTERNAL USE:
+
+        Compile the select conditions into a single function that takes
+        one cell value per select condition (in the same order), and
+        returns whether the row should be kept, after applying the
+        boolean operator. ``'AND'`` and ``'OR'`` short-circuit, so later
+        select conditions are not called for a row once the outcome is
+        known.
+
+        :param keepables: The select conditions (functions that each take
+         a cell value and return a bool, or ``NumericCondition``
+         objects).
+        :param bool_oper: Which boolean operator to apply -- either
+         ``'AND'``, ``'OR'``, or ``'XOR'``.
+        :param arg_idxs: (Optional) For each select condition, the index
+         of the argument (i.e. the cell value) that it applies to, so
+         that several select conditions can share the value of one
+         column. Defaults to one argument per select condition.
+        :return: The compiled function.
+        """
+        operator = bool_oper.upper()
+        joiners = {'AND': ' and ', 'OR': ' or ', 'XOR': ' ^ '}
+        if operator not in joiners:
+            raise ValueError(
+                f"`operator` must be one of ['OR', 'AND', 'XOR']. "
+                f"Passed {operator!r}")
+        if arg_idxs is None:
+            arg_idxs = range(len(keepables))
+        namespace = {}
+        args = [f"val_{j}" for j in range(max(arg_idxs, default=-1) + 1)]
+        exprs = []
+        for i, (keepable, j) in enumerate(zip(keepables, arg_idxs)):
+            if isinstance(keepable, NumericCondition):
+                # Compare inline, rather than calling a function.
+                namespace[f"threshold_{i}"] = keepable.threshold
+                expr = (
+                    f"(val_{j} is not None "
+                    f"and val_{j} {keepable.op} threshold_{i})")
+            else:
+                namespace[f"keepable_{i}"] = keepable
+                expr = f"keepable_{i}(val_{j})"
+            if operator == 'XOR':
+                expr = f"bool({expr})"
+            exprs.append(expr)
+        # The source is generated only from the names above, so it is
+        # safe to evaluate. Each select condition is bound as a global of
+        # the compiled function, rather than looked up in a dict per row.
+        source = f"lambda {', '.join(args)}: {joiners[operator].join(exprs)}"
+        return eval(compile(source, '<predicate>', 'eval'), namespace)
+
     def find_match_col(self, header_row, match_col_name):
         """
         Find the match column number, based on its header name.
@@ -560,23 +1295,66 @@ class WorksheetWrapper:
         """
 
         self.mandate_loaded()
-        ws = self.ws
-
-        try:
-            match_col = [
-                c.column for c in ws[header_row] if c.value == match_col_name][0]
-        except IndexError:
+        match_col = self._header_index(header_row).get(match_col_name)
+        if match_col is None:
             raise RuntimeError(
                 f"ERROR! Could not find the column name {match_col_name!r} "
                 f"in header row ({header_row}).")
         return match_col
 
+    def invalidate_header_cache(self) -> None:
+        """
+        Discard the cached headers, so that the header row is read again
+        on the next lookup by ``.find_match_col()`` (or ``.cull()``).
+        Call this after changing any headers directly in ``.ws``.
+
+        :return: None
+        """
+        self._header_cache = None
+        return None
+
+    def _header_index(self, header_row) -> dict:
+        """
+        INTERNAL USE:
+
+        Get a dict of the headers in ``header_row``, whose values are
+        their column numbers (indexed to 1). The header row is only read
+        once for the current ``.ws``, and later lookups are served from
+        the cached dict.
+        """
+        cached = self._header_cache
+        if cached is not None:
+            ws, cached_header_row, header_idx = cached
+            if ws is self.ws and cached_header_row == header_row:
+                return header_idx
+        header_vals = next(
+            self.ws.iter_rows(
+                min_row=header_row, max_row=header_row, values_only=True),
+            ())
+        header_idx = {}
+        for col_num, header in enumerate(header_vals, start=1):
+            # Keep the first match only.
+            header_idx.setdefault(header, col_num)
+        self._header_cache = (self.ws, header_row, header_idx)
+        return header_idx
+
     def modifiable_rows(self, protected_rows=None) -> list:
         """
         Get a list of row numbers that currently exist in the
         spreadsheet (indexed to 1), and which are NOT in
         ``protected_rows``.
 
+        :param protected_rows: (Optional) A collection of row numbers
+         (indexed to 1) that should never be deleted. If not specified
+         here, will pull from what is set in ``.protected_rows``.
+        """
+        return list(self.iter_modifiable_rows(protected_rows))
+
+    def iter_modifiable_rows(self, protected_rows=None):
+        """
+        Like ``.modifiable_rows()``, but get an iterator of the row
+        numbers, rather than building a list of them.
+
         :param protected_rows: (Optional) A collection of row numbers
          (indexed to 1) that should never be deleted. If not specified
          here, will pull from what is set in ``.protected_rows``.
@@ -587,11 +1365,15 @@ class WorksheetWrapper:
         if protected_rows is None:
             protected_rows = set()
         protected_rows = self._populate_protected_rows(protected_rows)
-        row_nums = [
-            j for j in range(1, self.ws.max_row + 1)
-            if j not in protected_rows
-        ]
-        return row_nums
+        max_row = self._max_row()
+        # Mark the protected rows in a bytearray, so the rows can be
+        # filtered at C level rather than hashing each row number.
+        unprotected = bytearray(b'\x01') * (max_row + 1)
+        unprotected[0] = 0
+        for row_num in protected_rows:
+            if 0 < row_num <= max_row:
+                unprotected[row_num] = 0
+        return compress(range(max_row + 1), unprotected)
 
     def add_formulas(
             self,
@@ -599,6 +1381,7 @@ class WorksheetWrapper:
             rows=None,
             protected_rows=None,
             number_formats: dict = None,
+            track_modified=True,
     ) -> dict:
         """
         Add formulas to the working spreadsheet in ``.ws``.
@@ -618,6 +1401,15 @@ class WorksheetWrapper:
                 "S": lambda row_num: "=AB{0}*AC{0}".format(row_num)
             }
 
+        A value may instead be a ``%``-style template string, in which
+        every ``%d`` is filled with the row number (e.g.,
+        ``"=AB%d*AC%d"`` for column S above), which avoids calling a
+        function for every row. If the template contains ``{row}``, then
+        every ``{row}`` is filled with the row number instead (and any
+        ``%`` is left as-is -- e.g., ``"=AB{row}*AC{row}"``). (Likewise,
+        a function that has a ``.template`` attribute will be treated as
+        that template.)
+
         :param rows: The rows where formulas should be added. If
          ``rows`` is specified here, it will IGNORE ``protected_rows``
          (potentially adding formulas to all rows in ``rows``, even if
@@ -652,9 +1444,18 @@ class WorksheetWrapper:
                 "S": BUILTIN_FORMATS[2]  # number format of '0.00'
             }
 
+         A value may instead be an openpyxl ``NamedStyle``, which will
+         be applied to those cells in place of their existing style (and
+         registered with the workbook, if it isn't already).
+
+        :param track_modified: (Optional) Whether to return the names of
+         the cells that were modified. Pass ``False`` to skip building
+         those lists, if they will not be used. Defaults to ``True``.
+
         :return: A dict, keyed by Column letter, whose values are a list
          of the cell names that were modified (e.g.,
-         ``{'A': ['A2', 'A3']}``).
+         ``{'A': ['A2', 'A3']}``) -- or ``None`` for each column, if
+         ``track_modified=False``.
         """
         if number_formats is None:
             number_formats = {}
@@ -666,50 +1467,157 @@ class WorksheetWrapper:
         if rows is None:
             rows = self.modifiable_rows(protected_rows=protected_rows)
         modified_cells_by_column = {}
+        if self.streaming and formulas:
+            # Every column shares the same rows, so look up their
+            # original row numbers (and their formula dicts) only once.
+            rows = list(rows)
+            row_formulas = [
+                self._formula_cells.setdefault(orig_row_num, {})
+                for orig_row_num in self._orig_row_nums(rows)
+            ]
         for column, formula in formulas.items():
             num_format = number_formats.get(column, None)
+            if self.streaming:
+                modified_cells_by_column[column] = self._stage_formulas(
+                    column, rows, row_formulas, formula, num_format,
+                    track_modified)
+                continue
             modified_cells = add_formulas_to_column(
                 ws=self.ws,
                 column=column,
                 rows=rows,
                 formula=formula,
-                number_format=num_format)
+                number_format=num_format,
+                track_modified=track_modified)
             modified_cells_by_column[column] = modified_cells
         self.last_protected_rows = protected_rows
         return modified_cells_by_column
 
-    @staticmethod
-    def _apply_bool_operator(list_of_sets: list, operator: str) -> set:
+    def _orig_row_nums(self, rows) -> list:
         """
-        INTERNAL USE:
-        Apply the specified boolean operator to a list of sets.
+        INTERNAL USE (streaming mode):
 
-        :param list_of_sets: A list of sets to which to apply the bool
-         operator.
-        :param operator: Which boolean operator to apply -- either
-         ``'AND'``, ``'OR'``, or ``'XOR'``.
-        :return: A set of the resulting elements.
-        """
-        list_of_sets = list_of_sets.copy()
-        operator = operator.upper()
-        final = set()
-        if list_of_sets:
-            final = list_of_sets.pop()
-            final = final.copy()
-        if operator == 'OR':
-            for new_set in list_of_sets:
-                final.update(new_set)
-        elif operator == 'AND':
-            for new_set in list_of_sets:
-                final.intersection_update(new_set)
-        elif operator == 'XOR':
-            for new_set in list_of_sets:
-                final = final ^ new_set
-        else:
+        Get the original row number of each of the current ``rows``
+        (i.e., before anything was culled). Rows beyond the last current
+        row are mapped to the same distance beyond the last original row.
+        """
+        row_map = self._row_map
+        if row_map is None:
+            return list(rows)
+        max_row = self._max_row()
+        beyond = self.ws.max_row - max_row
+        return [
+            row_map[row - 1] if row <= max_row else row + beyond
+            for row in rows
+        ]
+
+    def _stage_formulas(
+            self,
+            column,
+            rows,
+            row_formulas,
+            formula,
+            number_format=None,
+            track_modified=True) -> list:
+        """
+        INTERNAL USE (streaming mode):
+
+        Generate the formulas for a column, to be written when the rows
+        are streamed into the copy by ``WorkbookWrapper.save_wb()``.
+        Formulas are stored against the original row numbers, so that
+        they follow their rows through any later ``.cull()``.
+
+        :param row_formulas: The dict from ``._formula_cells`` for the
+         original row of each of the ``rows`` (in the same order).
+        :return: A list of all cell names that will be modified (e.g.,
+         ``['A2', 'A3']``.), or ``None`` if not ``track_modified``.
+        """
+        col_idx = column_index_from_string(column)
+        for formulas_dict, row_formula in zip(
+                row_formulas, _formula_strings(formula, rows)):
+            formulas_dict[col_idx] = (row_formula, number_format)
+        if not track_modified:
+            return None
+        return [f"{column}{row}" for row in rows]
+
+
+class NumericCondition:
+    """
+    A select condition for ``WorksheetWrapper.cull()`` that compares
+    each cell value against a fixed threshold -- e.g.,
+    ``NumericCondition('>=', 10)`` in place of ``lambda val: val >= 10``.
+
+    Because the comparison is known ahead of time, ``.cull()`` compiles
+    it directly into the predicate that is applied to each row, so no
+    function gets called per row for this condition. Blank cells (i.e.
+    ``None``) never match.
+
+    (A ``NumericCondition`` can also be called like any other select
+    condition.)
+    """
+
+    OPERATORS = {'<': lt, '<=': le, '>': gt, '>=': ge, '==': eq, '!=': ne}
+
+    def __init__(self, op: str, threshold):
+        """
+        :param op: The comparison to make, as ``cell_value <op>
+         threshold``. One of ``'<'``, ``'<='``, ``'>'``, ``'>='``,
+         ``'=='``, or ``'!='``.
+        :param threshold: The value to compare each cell value against.
+        """
+        if op not in self.OPERATORS:
             raise ValueError(
-                f"`operator` must be one of ['OR', 'AND', 'XOR']. "
-                f"Passed {operator!r}")
-        return final
+                f"`op` must be one of {list(self.OPERATORS)}. Passed {op!r}")
+        self.op = op
+        self.threshold = threshold
+
+    def __call__(self, value):
+        return value is not None and self.OPERATORS[self.op](
+            value, self.threshold)
+
+    def __repr__(self):
+        return f"NumericCondition({self.op!r}, {self.threshold!r})"
+
+
+def _fastcopy(src, dst) -> None:
+    """
+    INTERNAL USE:
+    Copy the file at ``src`` to ``dst`` (contents only). Where the OS
+    supports it, the copy is done in the kernel with
+    ``os.copy_file_range()`` (which lets filesystems like btrfs or XFS
+    share the underlying blocks); otherwise, or if that fails before
+    anything is written, falls back to ``shutil.copyfile()`` (itself
+    ``sendfile()``/``fcopyfile()``-accelerated where available).
+
+    :param src: Filepath of the file to copy.
+    :param dst: Filepath to copy to.
+    :raises shutil.SameFileError: If ``src`` and ``dst`` are the same
+     file (checked before ``dst`` is opened, which would truncate it).
+    :return: None
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    if hasattr(os, 'copy_file_range'):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            copied = 0
+            try:
+                while remaining > 0:
+                    n = os.copy_file_range(
+                        fsrc.fileno(), fdst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    copied += n
+                    remaining -= n
+            except OSError:
+                # e.g., unsupported across these filesystems.
+                if copied:
+                    raise
+            else:
+                if remaining <= 0:
+                    return None
+    shutil.copyfile(src, dst)
+    return None
 
 
 def find_ranges(nums: set) -> list:
@@ -721,11 +1629,493 @@ def find_ranges(nums: set) -> list:
     :return: A list of 2-tuples of integers, being the min and max
      of each range (inclusive).
     """
-    nnums = list(nums)
-    nnums.sort()
-    starts = [n for n in nnums if n - 1 not in nums]
-    ends = [n for n in nnums if n + 1 not in nums]
-    return [*zip(starts, ends)]
+    nnums = sorted(nums)
+    if not nnums:
+        return []
+    ranges = []
+    start = end = nnums[0]
+    for n in islice(nnums, 1, None):
+        if n != end + 1:
+            ranges.append((start, end))
+            start = n
+        end = n
+    ranges.append((start, end))
+    return ranges
+
+
+def _stream_rows(
+        rows,
+        out_ws,
+        style_cache: dict,
+        kept_rows: list = None,
+        formula_cells: dict = None,
+) -> None:
+    """
+    Stream the rows of a read-only worksheet into a write-only worksheet,
+    carrying over cell values and cell styles.
+
+    :param rows: An iterable of the rows (tuples of read-only cells) of
+     the worksheet to read from.
+    :param out_ws: An openpyxl write-only worksheet to append to.
+    :param style_cache: A dict to cache the styles of the write-only
+     workbook, keyed by the style ID of the read-only workbook. Reuse the
+     same dict for every worksheet that is streamed into the same
+     write-only workbook.
+    :param kept_rows: (Optional) A sorted list of the row numbers
+     (indexed to 1) to stream. If not specified, every row is streamed.
+    :param formula_cells: (Optional) A dict, keyed by row number, whose
+     values are dicts keyed by column number (indexed to 1), whose
+     values are 2-tuples of the formula and number format (or ``None``)
+     to write to that cell in place of its current value.
+    :return: None
+    """
+    if formula_cells is None:
+        formula_cells = {}
+    keep = None
+    if kept_rows is not None:
+        keep = set(kept_rows)
+    row_num = 0
+    for row_num, row in enumerate(rows, start=1):
+        if keep is not None and row_num not in keep:
+            continue
+        out_row = [
+            _write_only_cell(out_ws, cell, cell.value, style_cache)
+            for cell in row
+        ]
+        _add_formula_cells(
+            out_ws, row, out_row, formula_cells.get(row_num), style_cache)
+        out_ws.append(out_row)
+    # Any formulas added beyond the last row of the original worksheet.
+    last_row_num = row_num
+    for extra_row_num in sorted(k for k in formula_cells if k > last_row_num):
+        for _ in range(last_row_num + 1, extra_row_num):
+            out_ws.append([])
+        out_row = []
+        _add_formula_cells(
+            out_ws, (), out_row, formula_cells[extra_row_num], style_cache)
+        out_ws.append(out_row)
+        last_row_num = extra_row_num
+    return None
+
+
+def _add_formula_cells(out_ws, row, out_row, row_formulas, style_cache):
+    """
+    INTERNAL USE:
+
+    Write the formulas (if any) for this row into ``out_row``, in place.
+    """
+    if not row_formulas:
+        return None
+    for col_idx, (formula, number_format) in row_formulas.items():
+        while len(out_row) < col_idx:
+            out_row.append(None)
+        orig_cell = None
+        if col_idx <= len(row):
+            orig_cell = row[col_idx - 1]
+        out_row[col_idx - 1] = _write_only_cell(
+            out_ws, orig_cell, formula, style_cache, number_format)
+    return None
+
+
+def _write_only_cell(
+        out_ws, orig_cell, value, style_cache, number_format=None):
+    """
+    INTERNAL USE:
+
+    Get a write-only cell with the ``value`` and the style of the
+    ``orig_cell`` (a read-only cell), optionally overriding its
+    ``number_format`` (which may also be a ``NamedStyle``). If there is
+    no style to apply, the raw value is returned instead.
+
+    Each distinct style is only resolved once, and then cached in
+    ``style_cache`` to be shared with every later cell that uses it.
+    """
+    style_id = getattr(orig_cell, '_style_id', 0)
+    if not style_id and number_format == 'General':
+        # Unstyled cells are already 'General'.
+        number_format = None
+    if not style_id and number_format is None:
+        return value
+    cell = WriteOnlyCell(out_ws, value=value)
+    key = style_id
+    if number_format is not None:
+        key = (style_id, number_format)
+    style = style_cache.get(key)
+    if style is None:
+        if style_id:
+            cell.font = orig_cell.font
+            cell.fill = orig_cell.fill
+            cell.border = orig_cell.border
+            cell.alignment = orig_cell.alignment
+            cell.protection = orig_cell.protection
+            cell.number_format = orig_cell.number_format
+        if isinstance(number_format, NamedStyle):
+            cell.style = number_format
+        elif number_format is not None:
+            cell.number_format = number_format
+        style_cache[key] = copy(cell._style)
+    else:
+        cell._style = copy(style)
+    return cell
+
+
+# `fast_xml` only: the parts of the .xlsx archive that may need to be
+# patched, identified by the end of their content type.
+_CONTENT_TYPES_PART = '[Content_Types].xml'
+_PART_CONTENT_TYPES = {
+    'workbook': '.main+xml',
+    'styles': '.spreadsheetml.styles+xml',
+    'calc_chain': '.spreadsheetml.calcChain+xml',
+}
+_OVERRIDE = re.compile(rb'<(?:\w+:)?Override\b[^>]*>')
+_XML_ATTR = re.compile(r'([\w:]+)="([^"]*)"')
+_CALC_CHAIN_REF = re.compile(
+    rb'<(?:\w+:)?(?:Override|Relationship)\b[^>]*calcChain[^>]*>')
+_SHEET_DATA = re.compile(rb'<((?:\w+:)?)sheetData\b[^>]*?(/?)>')
+_DIMENSION = re.compile(rb'<((?:\w+:)?)dimension\b[^>]*?/>')
+_SHEET_NAME = re.compile(rb'(<(?:\w+:)?sheet\b[^>]*?\sname=")([^"]*)(")')
+_ATTR_ENTITIES = {'"': '&quot;'}
+_ATTR_UNENTITIES = {'&quot;': '"', '&apos;': "'"}
+
+
+def _content_type_parts(content_types_xml: bytes) -> dict:
+    """
+    INTERNAL USE (``fast_xml=True``):
+
+    Find the archive paths of the workbook, styles, and calculation
+    chain parts listed in ``[Content_Types].xml``. Returns a dict keyed
+    by ``'workbook'``, ``'styles'``, and ``'calc_chain'`` (for whichever
+    of them exist).
+    """
+    parts = {}
+    for override in _OVERRIDE.findall(content_types_xml):
+        attrs = dict(_XML_ATTR.findall(override.decode('utf-8')))
+        content_type = attrs.get('ContentType', '')
+        for key, suffix in _PART_CONTENT_TYPES.items():
+            if content_type.endswith(suffix):
+                parts[key] = attrs['PartName'].lstrip('/')
+    return parts
+
+
+def _rename_sheets_xml(workbook_xml: bytes, renames: dict) -> bytes:
+    """
+    INTERNAL USE (``fast_xml=True``):
+
+    Rename sheets in the XML of the workbook part.
+
+    :param workbook_xml: The contents of the workbook part.
+    :param renames: A dict, keyed by original sheet name, whose values
+     are the new sheet names.
+    """
+    def rename(match):
+        old = unescape(match.group(2).decode('utf-8'), _ATTR_UNENTITIES)
+        if old not in renames:
+            return match.group(0)
+        new = escape(renames[old], _ATTR_ENTITIES).encode('utf-8')
+        return match.group(1) + new + match.group(3)
+
+    return _SHEET_NAME.sub(rename, workbook_xml)
+
+
+def _write_sheet_xml(
+        sheet_xml: bytes,
+        out,
+        rows,
+        dimension: str,
+        kept_rows: list = None,
+        formula_cells: dict = None,
+        styles=None,
+        epoch=None,
+) -> None:
+    """
+    INTERNAL USE (``fast_xml=True``):
+
+    Write the XML of a worksheet part to ``out``, keeping everything in
+    the original ``sheet_xml`` except its ``<sheetData>`` (and its
+    ``<dimension>``), which is written fresh from ``rows``. Cells keep
+    the style IDs from the original workbook, so they need no styles of
+    their own. Strings are written inline.
+
+    See ``_stream_rows()`` for ``rows``, ``kept_rows``, and
+    ``formula_cells``.
+
+    :param sheet_xml: The original contents of the worksheet part.
+    :param out: A writable binary file object.
+    :param dimension: The range of cells that will be written (e.g.
+     ``'A1:K62'``).
+    :param styles: A ``_StylesPatch`` for the workbook, to resolve the
+     number formats of any formulas.
+    :param epoch: The epoch of the workbook (for writing dates).
+    :return: None
+    """
+    match = _SHEET_DATA.search(sheet_xml)
+    if match is None:
+        raise ValueError("Worksheet XML has no <sheetData> element.")
+    prefix = match.group(1).decode('utf-8')
+    end = match.end()
+    if not match.group(2):
+        closing = b'</' + match.group(1) + b'sheetData>'
+        end = sheet_xml.index(closing, end) + len(closing)
+    head = _DIMENSION.sub(
+        lambda m: b'<%sdimension ref="%s"/>' % (m.group(1), dimension.encode()),
+        sheet_xml[:match.start()],
+        count=1)
+    out.write(head)
+    out.write(f'<{prefix}sheetData>'.encode('utf-8'))
+    if formula_cells is None:
+        formula_cells = {}
+    keep = None
+    if kept_rows is not None:
+        keep = set(kept_rows)
+    letters = []
+    chunk = []
+    out_row_num = 0
+    orig_row_num = 0
+    for orig_row_num, row in enumerate(rows, start=1):
+        if keep is not None and orig_row_num not in keep:
+            continue
+        out_row_num += 1
+        cells = [
+            (getattr(cell, '_style_id', 0), cell.value, cell.data_type)
+            for cell in row
+        ]
+        _add_formula_specs(cells, formula_cells.get(orig_row_num), styles)
+        chunk.append(_row_xml(out_row_num, cells, letters, prefix, epoch))
+        if len(chunk) >= 1000:
+            out.write(''.join(chunk).encode('utf-8'))
+            chunk.clear()
+    # Any formulas added beyond the last row of the original worksheet.
+    for extra_row_num in sorted(k for k in formula_cells if k > orig_row_num):
+        cells = []
+        _add_formula_specs(cells, formula_cells[extra_row_num], styles)
+        chunk.append(_row_xml(
+            out_row_num + extra_row_num - orig_row_num,
+            cells, letters, prefix, epoch))
+    chunk.append(f'</{prefix}sheetData>')
+    out.write(''.join(chunk).encode('utf-8'))
+    out.write(sheet_xml[end:])
+    return None
+
+
+def _add_formula_specs(cells, row_formulas, styles) -> None:
+    """
+    INTERNAL USE (``fast_xml=True``):
+
+    Write the formulas (if any) for this row into ``cells`` (a list of
+    3-tuples of style ID, value, and data type), in place.
+    """
+    if not row_formulas:
+        return None
+    for col_idx, (formula, number_format) in row_formulas.items():
+        while len(cells) < col_idx:
+            cells.append((0, None, 'n'))
+        style_id = cells[col_idx - 1][0]
+        if number_format is not None and styles is not None:
+            style_id = styles.xf_id(style_id, number_format)
+        data_type = 'n'
+        if isinstance(formula, str) and formula.startswith('='):
+            data_type = 'f'
+        cells[col_idx - 1] = (style_id, formula, data_type)
+    return None
+
+
+def _row_xml(row_num, cells, letters, prefix, epoch) -> str:
+    """
+    INTERNAL USE (``fast_xml=True``):
+
+    Get the XML for a ``<row>`` of cells (each a 3-tuple of style ID,
+    value, and data type). Column letters are cached in ``letters``
+    (a list, indexed to 0) as they are needed.
+    """
+    while len(letters) < len(cells):
+        letters.append(get_column_letter(len(letters) + 1))
+    c = prefix + 'c'
+    parts = [f'<{prefix}row r="{row_num}">']
+    for letter, (style_id, value, data_type) in zip(letters, cells):
+        attrs = f'{c} r="{letter}{row_num}"'
+        if style_id:
+            attrs += f' s="{style_id}"'
+        if value is None:
+            if style_id:
+                parts.append(f'<{attrs}/>')
+            continue
+        if data_type == 'f':
+            parts.append(f'<{attrs}>{_formula_xml(value, prefix)}</{c}>')
+            continue
+        if isinstance(value, bool):
+            attrs += ' t="b"'
+            value = int(value)
+        elif isinstance(value, (date, time, timedelta)):
+            value = to_excel(value, epoch)
+        elif data_type == 'e':
+            attrs += ' t="e"'
+        elif not isinstance(value, (int, float)):
+            parts.append(
+                f'<{attrs} t="inlineStr"><{prefix}is>'
+                f'<{prefix}t xml:space="preserve">{escape(str(value))}'
+                f'</{prefix}t></{prefix}is></{c}>')
+            continue
+        parts.append(f'<{attrs}><{prefix}v>{value}</{prefix}v></{c}>')
+    if len(parts) == 1:
+        return ''
+    parts.append(f'</{prefix}row>')
+    return ''.join(parts)
+
+
+def _formula_xml(formula, prefix) -> str:
+    """
+    INTERNAL USE (``fast_xml=True``):
+
+    Get the XML for the ``<f>`` element of a formula cell. The
+    ``formula`` is either a string (e.g., ``'=A1+B1'``), or (if loaded
+    with ``data_only=False``) an openpyxl ``ArrayFormula`` or
+    ``DataTableFormula``, whose attributes (``t``, ``ref``, etc.) are
+    written as-is -- as openpyxl itself does.
+    """
+    attrs = ''
+    text = formula
+    if not isinstance(formula, str):
+        attrs = ''.join(
+            f' {name}="{escape(val, _ATTR_ENTITIES)}"'
+            for name, val in formula)
+        # Data table formulas have no text of their own.
+        text = getattr(formula, 'text', None)
+    if not text:
+        return f'<{prefix}f{attrs}/>'
+    if text.startswith('='):
+        text = text[1:]
+    return f'<{prefix}f{attrs}>{escape(text)}</{prefix}f>'
+
+
+class _StylesPatch:
+    """
+    INTERNAL USE (``fast_xml=True``):
+
+    The styles part of a workbook, to which new cell formats can be
+    added (each a copy of an existing cell format, but with a different
+    number format), without otherwise touching the original XML.
+    """
+
+    _CELL_XFS = re.compile(
+        r'(<(?:\w+:)?cellXfs\b[^>]*>)(.*?)(</(?:\w+:)?cellXfs>)', re.S)
+    _XF = re.compile(r'<(?:\w+:)?xf\b[^>]*?(?:/>|>.*?</(?:\w+:)?xf>)', re.S)
+    _NUM_FMTS = re.compile(
+        r'<((?:\w+:)?)numFmts\b[^>]*?(?:/>|>(.*?)</(?:\w+:)?numFmts>)', re.S)
+    _NUM_FMT = re.compile(r'<(?:\w+:)?numFmt\b[^>]*>')
+    _STYLE_SHEET = re.compile(r'<((?:\w+:)?)styleSheet\b[^>]*>')
+    _COUNT = re.compile(r'\scount="\d*"')
+
+    def __init__(self, styles_xml: str):
+        self.styles_xml = styles_xml
+        self.xfs = self._XF.findall(self._CELL_XFS.search(styles_xml).group(2))
+        self.orig_xf_count = len(self.xfs)
+        # Number formats declared in the workbook, keyed by format code.
+        self.num_fmts = {}
+        self.num_fmt_tags = []
+        num_fmts = self._NUM_FMTS.search(styles_xml)
+        if num_fmts is not None:
+            self.num_fmt_tags = self._NUM_FMT.findall(num_fmts.group(2) or '')
+        for num_fmt in self.num_fmt_tags:
+            attrs = dict(_XML_ATTR.findall(num_fmt))
+            code = unescape(attrs['formatCode'], _ATTR_UNENTITIES)
+            self.num_fmts[code] = int(attrs['numFmtId'])
+        self.new_num_fmts = {}
+        # New cell formats, keyed by (original style ID, number format).
+        self.new_xfs = {}
+
+    def xf_id(self, style_id: int, number_format) -> int:
+        """
+        Get the ID of a cell format that matches the cell format at
+        ``style_id``, except with the ``number_format`` (a format code
+        or a ``NamedStyle``, whose number format is used).
+        """
+        if isinstance(number_format, NamedStyle):
+            number_format = number_format.number_format
+        key = (style_id, number_format)
+        xf_id = self.new_xfs.get(key)
+        if xf_id is None:
+            if style_id >= self.orig_xf_count:
+                style_id = 0
+            xf = self.xfs[style_id]
+            if number_format == 'General' and self._is_general(xf):
+                # Already 'General' -- no need for a new cell format.
+                return style_id
+            xf = _set_xml_attr(xf, 'numFmtId', self._num_fmt_id(number_format))
+            xf = _set_xml_attr(xf, 'applyNumberFormat', 1)
+            xf_id = self.new_xfs[key] = len(self.xfs)
+            self.xfs.append(xf)
+        return xf_id
+
+    @staticmethod
+    def _is_general(xf: str) -> bool:
+        """Whether the cell format ``xf`` uses the 'General' format."""
+        open_tag = xf[:xf.index('>')]
+        return dict(_XML_ATTR.findall(open_tag)).get('numFmtId', '0') == '0'
+
+    def _num_fmt_id(self, code: str) -> int:
+        """Get (or assign) the ID of the number format ``code``."""
+        for declared in (self.num_fmts, self.new_num_fmts):
+            if code in declared:
+                return declared[code]
+        declared_ids = {*self.num_fmts.values(), *self.new_num_fmts.values()}
+        builtin_id = BUILTIN_FORMATS_REVERSE.get(code)
+        if builtin_id is not None and builtin_id not in declared_ids:
+            return builtin_id
+        # Custom number formats start at 164.
+        new_id = max({163, *declared_ids}) + 1
+        self.new_num_fmts[code] = new_id
+        return new_id
+
+    def to_xml(self) -> bytes:
+        """Get the XML of the styles part, with any new formats added."""
+        styles_xml = self.styles_xml
+        if not self.new_xfs:
+            return styles_xml.encode('utf-8')
+        match = self._CELL_XFS.search(styles_xml)
+        open_tag = self._COUNT.sub(f' count="{len(self.xfs)}"', match.group(1))
+        styles_xml = (
+            styles_xml[:match.start()]
+            + open_tag + ''.join(self.xfs) + match.group(3)
+            + styles_xml[match.end():])
+        if self.new_num_fmts:
+            prefix = self._STYLE_SHEET.search(styles_xml).group(1)
+            new_fmts = ''.join(
+                f'<{prefix}numFmt numFmtId="{fmt_id}" '
+                f'formatCode="{escape(code, _ATTR_ENTITIES)}"/>'
+                for code, fmt_id in self.new_num_fmts.items())
+            count = len(self.num_fmt_tags) + len(self.new_num_fmts)
+            num_fmts = (
+                f'<{prefix}numFmts count="{count}">'
+                + ''.join(self.num_fmt_tags) + new_fmts
+                + f'</{prefix}numFmts>')
+            match = self._NUM_FMTS.search(styles_xml)
+            if match is None:
+                # `<numFmts>` must be the first child of `<styleSheet>`.
+                match = self._STYLE_SHEET.search(styles_xml)
+                start = end = match.end()
+            else:
+                start, end = match.span()
+            styles_xml = styles_xml[:start] + num_fmts + styles_xml[end:]
+        return styles_xml.encode('utf-8')
+
+
+def _set_xml_attr(elem: str, name: str, value) -> str:
+    """
+    INTERNAL USE:
+
+    Set an attribute in the opening tag of an XML element (a string).
+    """
+    end = elem.index('>')
+    if elem[end - 1] == '/':
+        end -= 1
+    tag = elem[:end]
+    attr = f' {name}="{value}"'
+    pattern = re.compile(rf'\s{name}="[^"]*"')
+    if pattern.search(tag):
+        tag = pattern.sub(attr, tag, count=1)
+    else:
+        tag += attr
+    return tag + elem[end:]
 
 
 def add_formulas_to_column(
@@ -734,6 +2124,7 @@ def add_formulas_to_column(
         rows: list,
         formula,
         number_format: str = None,
+        track_modified=True,
 ) -> list:
     """
     Add formulas to every row in a column in the worksheet, based on
@@ -749,6 +2140,11 @@ def add_formulas_to_column(
         # Generates '=F5*AB5/$S$1'   (for an example row 5).
         formula = lambda row_num: "=F{0}*AB{0}/$S$1".format(row_num)
 
+     ...or a ``%``-style template string, in which every ``%d`` is
+     filled with the row number (e.g., ``"=F%d*AB%d/$S$1"``) -- or, if
+     it contains ``{row}``, in which every ``{row}`` is filled instead
+     (e.g., ``"=F{row}*AB{row}/$S$1"``).
+
     :param number_format: (Optional) The number format to apply to each
      cell to which a formula gets written (e.g., ``'General'``).
      Reference openpyxl documentation_ for possible values and built-in
@@ -764,14 +2160,58 @@ def add_formulas_to_column(
 
      .. _documentation: https://openpyxl.readthedocs.io/en/stable/_modules/openpyxl/styles/numbers.html
 
+     May instead be an openpyxl ``NamedStyle``, to apply that style to
+     each cell in place of its existing style.
+
+    :param track_modified: (Optional) Whether to return the names of the
+     cells that were modified. Pass ``False`` to skip building that
+     list, if it will not be used. Defaults to ``True``.
+
     :return: A list of all cell names that were modified (e.g.,
-     ``['A2', 'A3']``.)
-    """
-    modified_cells = []
-    for row in rows:
-        cell_name = f"{column}{row}"
-        ws[cell_name] = formula(row)
-        if number_format is not None:
-            ws[cell_name].number_format = number_format
-        modified_cells.append(cell_name)
+     ``['A2', 'A3']``.), or ``None`` if ``track_modified=False``.
+    """
+    named_style = None
+    if isinstance(number_format, NamedStyle):
+        # Register the style once, and then apply it by name, so that
+        # openpyxl doesn't search its list of named styles per cell.
+        if number_format.name not in ws.parent.named_styles:
+            ws.parent.add_named_style(number_format)
+        named_style = number_format.name
+    rows = list(rows)
+    # Resolve the column once, rather than parsing a coordinate per cell.
+    col_idx = column_index_from_string(column)
+    modified_cells = [] if track_modified else None
+    for row, row_formula in zip(rows, _formula_strings(formula, rows)):
+        cell = ws.cell(row=row, column=col_idx, value=row_formula)
+        if named_style is not None:
+            cell.style = named_style
+        elif number_format is not None and cell.number_format != number_format:
+            # (e.g., new cells are already 'General'.)
+            cell.number_format = number_format
+        if track_modified:
+            modified_cells.append(f"{column}{row}")
     return modified_cells
+
+
+def _formula_strings(formula, rows) -> list:
+    """
+    INTERNAL USE:
+
+    Generate the formula for each of the ``rows`` in a single pass, from
+    either a function of the row number, or a template string in which
+    every ``{row}`` (or if there are none, every ``%d``) is filled with
+    the row number. (A function with a ``.template`` attribute is
+    treated as that template.)
+    """
+    # A function may opt in to being treated as a template.
+    formula = getattr(formula, 'template', formula)
+    if not isinstance(formula, str):
+        return [formula(row) for row in rows]
+    if '{row}' in formula:
+        # Join the pieces around each `{row}` with the row number.
+        pieces = formula.split('{row}')
+        return [str(row).join(pieces) for row in rows]
+    num_fields = formula.replace('%%', '').count('%')
+    if num_fields == 1:
+        return [formula % row for row in rows]
+    return [formula % ((row,) * num_fields) for row in rows]
@@ -1,10 +1,15 @@
 
-import os
+import shutil
 import unittest
 import random
+from datetime import datetime
+from io import BytesIO
 from pathlib import Path
 
 from openpyxl import Workbook
+from openpyxl.styles import Font
+from openpyxl.styles.numbers import BUILTIN_FORMATS
+from openpyxl.worksheet.formula import ArrayFormula
 from openpyxl.worksheet.worksheet import Worksheet
 
 try:
@@ -19,25 +24,37 @@ except ImportError:
 
 class FileHandler:
     """Helper class for unittest.TestCase."""
-    master = Path(r"test_data\test_data.xlsx")
-    temp_dir = Path(r".\test_temp")
+    master = Path("test_data/test_data.xlsx")
+    temp_dir = Path("test_temp")
     sheet_name = 'Sheet1'
     temp_fn = 'test_temp.xlsx'
     temp_fp = temp_dir / temp_fn
 
     def __init__(self):
         self.temp_wbwrapper = None
+        self._master_bytes = None
+
+    def master_bytes(self):
+        """
+        (Setup method.)
+        Get the contents of the master spreadsheet (read from disk only
+        once), for tests that load it from memory.
+        :return: The bytes of the master spreadsheet.
+        """
+        if self._master_bytes is None:
+            self._master_bytes = self.master.read_bytes()
+        return self._master_bytes
 
     def new_copy(self):
         """
         (Setup method.)
-        Get a fresh copy.
+        Get a fresh copy (written from the master spreadsheet already
+        in memory).
         :return: The new WorkbookWrapper.
         """
         self.clean_up()
-        self.temp_dir.mkdir(exist_ok=True)
         self.temp_wbwrapper = xlsx_copycull.WorkbookWrapper(
-            orig_fp=self.master,
+            orig_fp=BytesIO(self.master_bytes()),
             copy_fp=self.temp_fp
         )
         self.temp_wbwrapper.load_wb()
@@ -51,9 +68,8 @@ class FileHandler:
         :param kwargs: Optional kwargs for `.stage_ws()`
         :return: The new WorksheetWrapper.
         """
-        # Pop / discard existing keys and get a new WorksheetWrapper.
-        for k in self.temp_wbwrapper.ws_dict.copy().keys():
-            self.temp_wbwrapper.ws_dict.pop(k)
+        # Discard existing keys and get a new WorksheetWrapper.
+        self.temp_wbwrapper.ws_dict.clear()
         wswr = self.temp_wbwrapper.stage_ws(
             ws_name=self.sheet_name,
             header_row=1,
@@ -70,11 +86,7 @@ class FileHandler:
         if self.temp_wbwrapper is not None:
             self.temp_wbwrapper.close_wb()
         self.temp_wbwrapper = None
-        if self.temp_dir.exists():
-            for fn in os.listdir(self.temp_dir):
-                fp = self.temp_dir / fn
-                fp.unlink()
-            self.temp_dir.rmdir()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
 
 class UnitTest(unittest.TestCase):
@@ -97,6 +109,10 @@ class UnitTest(unittest.TestCase):
     def clean_up(self):
         return self.FH.clean_up()
 
+    def tearDown(self):
+        # Close any workbook left open by the test, and delete its files.
+        self.clean_up()
+
     def test_new_wbwrapper(self):
         """
         Creation of new WorkbookWrapper (and copying of master).
@@ -104,6 +120,21 @@ class UnitTest(unittest.TestCase):
         wb = self.new_copy()
         self.assertTrue(self.temp_fp.exists())
         self.assertTrue(wb.is_loaded)
+        wb.close_wb()
+        wb = xlsx_copycull.WorkbookWrapper(
+            orig_fp=self.master, copy_fp=self.temp_fp, streaming=True,
+            load_kwargs={'rich_text': False}, keep_links=True)
+        self.assertEqual(
+            wb.load_kwargs, {'rich_text': False, 'keep_links': True})
+        with self.assertRaises(ValueError):
+            xlsx_copycull.WorkbookWrapper(
+                orig_fp=BytesIO(self.FH.master_bytes()), no_copy=True)
+        # The same file, spelled differently, must not be truncated.
+        size = self.temp_fp.stat().st_size
+        with self.assertRaises(shutil.SameFileError):
+            xlsx_copycull.WorkbookWrapper(
+                orig_fp=self.temp_fp, copy_fp=self.temp_fp.resolve())
+        self.assertEqual(self.temp_fp.stat().st_size, size)
 
     def test_new_wswrapper(self):
         """
@@ -120,39 +151,30 @@ class UnitTest(unittest.TestCase):
         :return:
         """
         test_name = 'temp'
-        wbwp = self.new_copy()
-        wbwp.load_wb()
-        # Test with wbwp.rename_ws()
-        wswp = wbwp.stage_ws(self.sheet_name)
-        wbwp.rename_ws(self.sheet_name, test_name)
-        wswp = wbwp[test_name]
-        self.assertEqual(wswp.ws.title, test_name)
-        self.assertNotEqual(wswp.ws.title, self.sheet_name)
-        # Test subscripting old and new sheetnames.
-        wswp = wbwp[test_name]
-        with self.assertRaises(KeyError):
-            wbwp[self.sheet_name]
-
-        # Test at stage_ws().
-        self.new_copy()
-        wswp = self.reload_wswrapper(rename_ws=test_name)
-        self.assertEqual(wswp.ws.title, test_name)
-        self.assertNotEqual(wswp.ws.title, self.sheet_name)
-        # Test subscripting old and new sheetnames.
-        wswp = wbwp[test_name]
-        with self.assertRaises(KeyError):
-            wbwp[self.sheet_name]
 
-        # Test after init.
-        self.new_copy()
-        wswp = self.reload_wswrapper()
-        wswp.rename_ws(test_name)
-        self.assertEqual(wswp.ws.title, test_name)
-        self.assertNotEqual(wswp.ws.title, self.sheet_name)
-        # Test subscripting old and new sheetnames.
-        wswp = wbwp[test_name]
-        with self.assertRaises(KeyError):
-            wbwp[self.sheet_name]
+        def rename_with_wbwrapper(wbwp):
+            wbwp.stage_ws(self.sheet_name)
+            wbwp.rename_ws(self.sheet_name, test_name)
+
+        def rename_at_stage_ws(wbwp):
+            self.reload_wswrapper(rename_ws=test_name)
+
+        def rename_with_wswrapper(wbwp):
+            self.reload_wswrapper().rename_ws(test_name)
+
+        for rename in (
+                rename_with_wbwrapper,
+                rename_at_stage_ws,
+                rename_with_wswrapper):
+            with self.subTest(mode=rename.__name__):
+                wbwp = self.new_copy()
+                rename(wbwp)
+                wswp = wbwp[test_name]
+                self.assertEqual(wswp.ws.title, test_name)
+                self.assertNotEqual(wswp.ws.title, self.sheet_name)
+                # Test subscripting the old sheetname.
+                with self.assertRaises(KeyError):
+                    wbwp[self.sheet_name]
 
     def test_is_loaded(self):
         # Test while open (assert True).
@@ -191,21 +213,28 @@ class UnitTest(unittest.TestCase):
         # _inform_subordinates().
         wswp.ws = None
         wbwp._inform_subordinates()
-        self.assertTrue(isinstance(wswp.ws, Worksheet))
+        self.assertIsInstance(wswp.ws, Worksheet)
         # Manually set worksheet to an actual value.
         ws_holder = wswp.ws
         wbwp.close_wb()
-        self.assertTrue(wswp.ws is None)
+        self.assertIsNone(wswp.ws)
         wswp.ws = ws_holder
         # This should reset all worksheets to None.
         wbwp._inform_subordinates()
-        self.assertTrue(wswp.ws is None)
+        self.assertIsNone(wswp.ws)
 
     def test_mandate_loaded(self):
         wbwp = self.new_copy()
         wbwp.close_wb()
         with self.assertRaises(RuntimeError):
             wbwp.mandate_loaded()
+        wbwp.autoload = True
+        wswp = self.reload_wswrapper()
+        self.assertFalse(wswp.is_loaded)
+        wswp.mandate_loaded()
+        self.assertTrue(wbwp.is_loaded)
+        self.assertTrue(wswp.is_loaded)
+        wbwp.close_wb()
 
     # WSWP methods
     def test_populate_protected_rows(self):
@@ -217,16 +246,17 @@ class UnitTest(unittest.TestCase):
         def compare_test_vals(vals, ws):
             # Compare the remaining row vals against the originally
             # collected `vals`.
-            remaining_vals = [
-                ws[f"A{row_num}"].value for row_num in range(2, ws.max_row + 1)
-            ]
-            self.assertEqual(vals, remaining_vals)
+            remaining_vals = next(ws.iter_cols(
+                min_col=1, max_col=1, min_row=2, values_only=True))
+            self.assertEqual(vals, list(remaining_vals))
             return None
 
         def confirm_no_fomulas(ws):
             # Confirm that no formulas were added to any protected rows.
-            for row_num in range(2, ws.max_row + 1):
-                self.assertTrue(ws[f"F{row_num}"].value is None)
+            col_f = next(ws.iter_cols(
+                min_col=6, max_col=6, min_row=2, values_only=True))
+            for val in col_f:
+                self.assertIsNone(val)
 
         wbwp = self.new_copy()
         wswp = self.reload_wswrapper()
@@ -263,8 +293,11 @@ class UnitTest(unittest.TestCase):
         wbwp = self.new_copy()
         wswp = self.reload_wswrapper()
         wswp.cull(select_conditions={'a': lambda x: x >= 10})
-        for row_num in range(2, wswp.ws.max_row + 1):
-            self.assertTrue(wswp.ws.cell(row=row_num, column=1).value >= 10)
+        col_a = next(wswp.ws.iter_cols(
+            min_col=1, max_col=1, min_row=2, values_only=True))
+        self.assertTrue(col_a)
+        for val in col_a:
+            self.assertGreaterEqual(val, 10)
 
     def test_add_formulas(self):
         """Test .add_formulas method."""
@@ -273,6 +306,166 @@ class UnitTest(unittest.TestCase):
         wswp.add_formulas(formulas={"F": lambda row_num: f"=C{row_num}+D{row_num}"})
         self.assertEqual(wswp.ws['F3'].value, '=C3+D3')
         self.assertEqual(wswp.ws['F5'].value, '=C5+D5')
+        # Template strings.
+        wswp.add_formulas(formulas={"G": "=C%d*D%d", "H": "=G%d*100%%"})
+        self.assertEqual(wswp.ws['G3'].value, '=C3*D3')
+        self.assertEqual(wswp.ws['H3'].value, '=G3*100%')
+        wswp.add_formulas(formulas={"J": "=G{row}*100%"})
+        self.assertEqual(wswp.ws['J3'].value, '=G3*100%')
+        modified = wswp.add_formulas(
+            formulas={"I": "=H%d"}, track_modified=False)
+        self.assertEqual(modified, {"I": None})
+        self.assertEqual(wswp.ws['I3'].value, '=H3')
+
+    def test_streaming(self):
+        """Test .cull() and .add_formulas() in streaming mode."""
+        self.clean_up()
+        self.temp_dir.mkdir(exist_ok=True)
+        wbwp = xlsx_copycull.WorkbookWrapper(
+            orig_fp=self.master, copy_fp=self.temp_fp, streaming=True)
+        # Nothing is written until saved.
+        self.assertFalse(self.temp_fp.exists())
+        wbwp.load_wb()
+        wswp = wbwp.stage_ws(self.sheet_name, protected_rows=[2])
+        wswp.cull(select_conditions={'a': lambda x: x >= 10})
+        self.assertEqual(wswp.modifiable_rows(), [3, 4])
+        wswp.add_formulas(formulas={"F": lambda row_num: f"=C{row_num}+D{row_num}"})
+        wbwp.save_wb()
+        wbwp.close_wb()
+
+        # Reload the streamed copy in the normal mode to check it.
+        wbwp = xlsx_copycull.WorkbookWrapper(
+            orig_fp=self.temp_fp, no_copy=True)
+        wbwp.load_wb()
+        ws = wbwp.wb[self.sheet_name]
+        self.assertEqual(ws.max_row, 4)
+        self.assertEqual(
+            [ws[f"A{row_num}"].value for row_num in range(1, 5)],
+            ['a', 1, 10, 13])
+        self.assertEqual(ws['F2'].value, None)
+        self.assertEqual(ws['F3'].value, '=C3+D3')
+        self.assertEqual(ws['F4'].value, '=C4+D4')
+        wbwp.close_wb()
+
+        # Never stream over the original, however its path is spelled.
+        size = self.temp_fp.stat().st_size
+        wbwp = xlsx_copycull.WorkbookWrapper(
+            orig_fp=self.temp_fp, streaming=True, autoload=True)
+        with self.assertRaises(ValueError):
+            wbwp.save_wb(fp=self.temp_fp.resolve())
+        wbwp.close_wb()
+        self.assertEqual(self.temp_fp.stat().st_size, size)
+        self.clean_up()
+
+    def test_streaming_cache_rows(self):
+        """Test generating several copies from one streaming load."""
+        self.clean_up()
+        self.temp_dir.mkdir(exist_ok=True)
+        wbwp = xlsx_copycull.WorkbookWrapper(
+            orig_fp=BytesIO(self.FH.master_bytes()), streaming=True,
+            cache_rows=True)
+        wbwp.load_wb()
+        for animal, expected in [('cat', [1, 10]), ('rat', [4, 13])]:
+            wswp = wbwp.stage_ws(self.sheet_name)
+            wswp.cull(select_conditions={'d': lambda x: x == animal})
+            fp = self.temp_dir / f"{animal}.xlsx"
+            wbwp.save_wb(fp)
+            check_wbwp = xlsx_copycull.WorkbookWrapper(orig_fp=fp, no_copy=True)
+            check_wbwp.load_wb()
+            ws = check_wbwp.wb[self.sheet_name]
+            self.assertEqual(
+                [ws[f"A{row_num}"].value for row_num in range(2, ws.max_row + 1)],
+                expected)
+            check_wbwp.close_wb()
+        # Rows were only parsed once.
+        self.assertEqual(len(wbwp._row_cache), 1)
+        wbwp.close_wb()
+        self.clean_up()
+
+    def test_streaming_fast_xml(self):
+        """Test writing the culled sheet XML straight into the copy."""
+        self.clean_up()
+        self.temp_dir.mkdir(exist_ok=True)
+        wbwp = xlsx_copycull.WorkbookWrapper(
+            orig_fp=BytesIO(self.FH.master_bytes()), copy_fp=self.temp_fp,
+            streaming=True, fast_xml=True)
+        wbwp.load_wb()
+        wswp = wbwp.stage_ws(self.sheet_name, rename_ws='Renamed')
+        wswp.cull(select_conditions={'a': lambda x: x >= 10})
+        wswp.add_formulas(
+            formulas={"F": lambda row_num: f"=C{row_num}+D{row_num}"},
+            number_formats={"F": "0.000"})
+        wbwp.save_wb()
+        wbwp.close_wb()
+
+        wbwp = xlsx_copycull.WorkbookWrapper(
+            orig_fp=self.temp_fp, no_copy=True)
+        wbwp.load_wb()
+        ws = wbwp.wb['Renamed']
+        self.assertEqual(ws.max_row, 3)
+        self.assertEqual(
+            [ws[f"A{row_num}"].value for row_num in range(1, 4)],
+            ['a', 10, 13])
+        self.assertEqual(ws['F3'].value, '=C3+D3')
+        self.assertEqual(ws['F3'].number_format, '0.000')
+        wbwp.close_wb()
+        self.clean_up()
+
+    def test_streaming_fast_xml_cell_types(self):
+        """
+        Test that ``fast_xml`` carries over dates, bools, errors, array
+        formulas, and existing styles in a culled sheet.
+        """
+        self.clean_up()
+        wb = Workbook()
+        ws = wb.active
+        ws.title = 'Data'
+        ws.append(['a', 'when', 'flag', 'err', 'styled', 'arr'])
+        for n in range(1, 5):
+            ws.append([n, datetime(2020, 1, n), n % 2 == 0, '#N/A', n])
+            ws.cell(row=n + 1, column=5).font = Font(bold=True)
+        ws['F4'] = ArrayFormula('F4', '=SUM(A2:A3*2)')
+        orig = BytesIO()
+        wb.save(orig)
+        wb.close()
+
+        wbwp = xlsx_copycull.WorkbookWrapper(
+            orig_fp=orig, copy_fp=self.temp_fp, streaming=True,
+            fast_xml=True, data_only=False)
+        wbwp.load_wb()
+        wswp = wbwp.stage_ws('Data')
+        wswp.cull(select_conditions={'a': lambda x: x >= 3})
+        # No formulas at all must not break the save.
+        self.assertEqual(wswp.add_formulas(formulas={}), {})
+        wbwp.save_wb(fp=self.temp_dir / 'no_formulas.xlsx')
+        wswp.add_formulas(
+            formulas={'E': '=A%d*2'},
+            number_formats={'E': BUILTIN_FORMATS[2]})
+        wbwp.save_wb()
+        wbwp.close_wb()
+
+        wbwp = xlsx_copycull.WorkbookWrapper(
+            orig_fp=self.temp_fp, no_copy=True)
+        wbwp.load_wb()
+        ws = wbwp.wb['Data']
+        self.assertEqual(ws.max_row, 3)
+        self.assertEqual(
+            [cell.value for cell in ws[2]][:4],
+            [3, datetime(2020, 1, 3), False, '#N/A'])
+        self.assertEqual(
+            [cell.value for cell in ws[3]][:4],
+            [4, datetime(2020, 1, 4), True, '#N/A'])
+        self.assertEqual(ws['D2'].data_type, 'e')
+        # A built-in format on a cell that was already styled.
+        self.assertEqual(ws['E2'].value, '=A2*2')
+        self.assertEqual(ws['E2'].number_format, BUILTIN_FORMATS[2])
+        self.assertTrue(ws['E2'].font.b)
+        # The array formula is written as-is (not adjusted to its row).
+        self.assertIsInstance(ws['F2'].value, ArrayFormula)
+        self.assertEqual(ws['F2'].value.text, '=SUM(A2:A3*2)')
+        self.assertEqual(ws['F2'].value.ref, 'F4')
+        wbwp.close_wb()
+        self.clean_up()
 
     def test_find_match_col(self):
         wbwp = self.new_copy()
@@ -281,6 +474,10 @@ class UnitTest(unittest.TestCase):
         self.assertEqual(col_num, 3)
         with self.assertRaises(RuntimeError):
             wswp.find_match_col(header_row=1, match_col_name="Nope!")
+        # Headers edited directly are found once the cache is discarded.
+        wswp.ws['C1'] = 'renamed c'
+        wswp.invalidate_header_cache()
+        self.assertEqual(wswp.find_match_col(1, 'renamed c'), 3)
 
     def test_modifiable_rows(self):
         wbwp = self.new_copy()
@@ -292,16 +489,134 @@ class UnitTest(unittest.TestCase):
 
         wswp = self.reload_wswrapper()
         self.assertEqual(wswp.modifiable_rows(protected_rows=[2, 4, 6]), [3, 5])
+        self.assertEqual(
+            list(wswp.iter_modifiable_rows(protected_rows=[2, 4, 6])), [3, 5])
 
-    def test_apply_bool_operator(self):
-        both_sets = [{1, 2, 3}, {3, 4, 5}]
-        wswp_class = xlsx_copycull.WorksheetWrapper
+    def test_selectivity_order(self):
+        wbwp = self.new_copy()
+        wswp = self.reload_wswrapper()
+        keepables = [lambda x: True, lambda x: x == 10]
+        self.assertEqual(wswp._selectivity_order([0, 0], keepables, 'AND'), [1, 0])
+        self.assertEqual(wswp._selectivity_order([0, 0], keepables, 'OR'), [0, 1])
+
+    def test_cull_skips_protected_rows(self):
+        """Select conditions are never applied to protected rows."""
+        wbwp = self.new_copy()
+        wswp = self.reload_wswrapper(protected_rows=[2, 4])
+        checked = []
+        wswp.cull(select_conditions={'a': lambda x: checked.append(x) or True})
+        ws = wswp.ws
+        self.assertEqual(len(checked), ws.max_row - 3)
+        # Nor when sampled to order several select conditions.
+        wbwp = self.new_copy()
+        wswp = self.reload_wswrapper(protected_rows=[2, 4])
+        checked = []
+
+        def check(keep):
+            return lambda x: checked.append(x) or keep
+
+        wswp.cull(select_conditions={
+            'a': [check(True), check(False)], 'b': check(True)})
+        self.assertTrue(checked)
+        # The values in protected rows 2 and 4 (columns 'a' and 'b').
+        self.assertTrue(set(checked).isdisjoint({1, 7, 326, 869}))
+
+    def test_cull_all(self):
+        copy_name = 'Sheet2'
+
+        def stage_both():
+            wbwp = self.new_copy()
+            wbwp.wb.copy_worksheet(wbwp.wb[self.sheet_name]).title = copy_name
+            wswp1 = wbwp.stage_ws(self.sheet_name, protected_rows=[2])
+            wswp2 = wbwp.stage_ws(copy_name, protected_rows=[3])
+            return wbwp, wswp1, wswp2
+
+        def col_a(ws):
+            return list(next(ws.iter_cols(
+                min_col=1, max_col=1, min_row=2, values_only=True)))
+
+        wbwp, wswp1, wswp2 = stage_both()
+        wbwp.cull_all({
+            self.sheet_name: {'a': lambda x: x >= 10},
+            copy_name: {'d': lambda x: x == 'cat'},
+        })
+        # Each sheet is culled by its own conditions, sparing its own
+        # protected rows (which are then adjusted).
+        self.assertEqual(col_a(wswp1.ws), [1, 10, 13])
+        self.assertEqual(wswp1.protected_rows, {1, 2})
+        self.assertEqual(col_a(wswp2.ws), [1, 4, 10])
+        self.assertEqual(wswp2.protected_rows, {1, 3})
+
+        # An error in any select condition propagates, and no sheet is
+        # culled.
+        wbwp, wswp1, wswp2 = stage_both()
+        with self.assertRaises(ZeroDivisionError):
+            wbwp.cull_all({
+                self.sheet_name: {'a': lambda x: x >= 10},
+                copy_name: {'a': lambda x: x / 0},
+            })
+        self.assertEqual(col_a(wswp1.ws), [1, 4, 7, 10, 13])
+        self.assertEqual(col_a(wswp2.ws), [1, 4, 7, 10, 13])
+
+    def test_numeric_condition(self):
+        wbwp = self.new_copy()
+        wswp = self.reload_wswrapper()
+        wswp.cull(select_conditions={'a': xlsx_copycull.NumericCondition('>=', 10)})
+        ws = wswp.ws
         self.assertEqual(
-            wswp_class._apply_bool_operator(both_sets, 'AND'), {3})
+            [ws[f"A{row_num}"].value for row_num in range(2, ws.max_row + 1)],
+            [10, 13])
+        self.assertFalse(xlsx_copycull.NumericCondition('<', 10)(None))
+        wswp = self.reload_wswrapper()
+        wswp.cull(select_conditions={'a': (
+            xlsx_copycull.NumericCondition('>=', 10), lambda x: x < 13)})
+        self.assertEqual(
+            [ws[f"A{row_num}"].value for row_num in range(2, ws.max_row + 1)],
+            [10])
+        compare_column = xlsx_copycull.WorksheetWrapper._compare_column
+        condition = xlsx_copycull.NumericCondition('<', 10)
+        predicate = xlsx_copycull.WorksheetWrapper._compile_predicate(
+            [condition], 'AND')
         self.assertEqual(
-            wswp_class._apply_bool_operator(both_sets, 'OR'), {1, 2, 3, 4, 5})
+            compare_column(condition, [5, 10, None], predicate),
+            [True, False, False])
+        # Blank cells never match, on either path.
+        for op in ('==', '!='):
+            condition = xlsx_copycull.NumericCondition(op, 5)
+            predicate = xlsx_copycull.WorksheetWrapper._compile_predicate(
+                [condition], 'AND')
+            vals = [1, None, 5, None, 10]
+            with self.subTest(op=op):
+                self.assertEqual(
+                    compare_column(condition, vals, predicate),
+                    [condition(val) for val in vals])
+        wbwp = self.new_copy()
+        wswp = self.reload_wswrapper()
+        wswp.ws['A3'] = None
+        wswp.cull(select_conditions={
+            'a': xlsx_copycull.NumericCondition('!=', 10)})
+        ws = wswp.ws
         self.assertEqual(
-            wswp_class._apply_bool_operator(both_sets, 'XOR'), {1, 2, 4, 5})
+            [ws[f"A{row_num}"].value for row_num in range(2, ws.max_row + 1)],
+            [1, 7, 13])
+        with self.assertRaises(ValueError):
+            xlsx_copycull.NumericCondition('=>', 10)
+
+    def test_compile_predicate(self):
+        keepables = [lambda x: x > 1, lambda x: x < 3]
+        compile_predicate = xlsx_copycull.WorksheetWrapper._compile_predicate
+        vals = [1, 2, 3]
+        results = {
+            'AND': [False, True, False],
+            'OR': [True, True, True],
+            'XOR': [True, False, True],
+        }
+        for operator, expected in results.items():
+            predicate = compile_predicate(keepables, operator)
+            self.assertEqual(
+                [bool(predicate(v, v)) for v in vals], expected)
+        with self.assertRaises(ValueError):
+            compile_predicate(keepables, 'NAND')
 
     # Misc. functions
     def test_find_ranges(self):